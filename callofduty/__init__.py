@@ -12,13 +12,17 @@ from .client import Client
 from .enums import *
 from .errors import *
 from .feed import Blog, FeedItem, Video
-from .leaderboard import Leaderboard, LeaderboardEntry
+from .friends import Compendium, FriendUpdate
+from .identity import IdentityIndex, PlayerMap
+from .leaderboard import Leaderboard, LeaderboardColumns, LeaderboardEntry
 from .loadout import Loadout, LoadoutItem, LoadoutWeapon
-from .loot import LootItem, Season
+from .loot import LootCatalogue, LootItem, Season
 from .match import Match
 from .player import Player
+from .serialize import Deserialize, Serialize
 from .squad import Squad, SquadsReward, SquadsTournament
 from .stamp import AuthenticityStamp
+from .sync import FileMatchStore, MatchStore, MatchSync, MemoryMatchStore
 
 try:
     from logging import NullHandler
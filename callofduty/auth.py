@@ -86,17 +86,16 @@ class Auth:
 
         body: Dict[str, Optional[str]] = {"deviceId": self.DeviceId}
 
-        async with self.session as client:
-            res: httpx.Response = await client.post(self.registerDeviceUrl, json=body)
+        res: httpx.Response = await self.session.post(self.registerDeviceUrl, json=body)
 
-            if res.status_code != 200:
-                raise LoginFailure(
-                    f"Failed to register fake device (HTTP {res.status_code})"
-                )
+        if res.status_code != 200:
+            raise LoginFailure(
+                f"Failed to register fake device (HTTP {res.status_code})"
+            )
 
-            data: Union[dict, list] = res.json()
+        data: Union[dict, list] = res.json()
 
-            self._accessToken: Optional[str] = dict(data)["data"]["authHeader"]
+        self._accessToken: Optional[str] = dict(data)["data"]["authHeader"]
 
     async def SubmitLogin(self):
         """
@@ -111,20 +110,19 @@ class Auth:
 
         data: Dict[str, str] = {"email": self.email, "password": self.password}
 
-        async with self.session as client:
-            res: httpx.Response = await client.post(
-                self.loginUrl, json=data, headers=headers
-            )
+        res: httpx.Response = await self.session.post(
+            self.loginUrl, json=data, headers=headers
+        )
 
-            if res.status_code != 200:
-                raise LoginFailure(f"Failed to login (HTTP {res.status_code})")
-            elif isinstance(data := await JSONorText(res), dict):
-                if data.get("success") is not True:
-                    # The API tends to return HTTP 200 even when an error occurs
-                    raise LoginFailure(
-                        f"Failed to login (HTTP {res.status_code}), "
-                        + data.get("token", data)
-                    )
+        if res.status_code != 200:
+            raise LoginFailure(f"Failed to login (HTTP {res.status_code})")
+        elif isinstance(data := await JSONorText(res), dict):
+            if data.get("success") is not True:
+                # The API tends to return HTTP 200 even when an error occurs
+                raise LoginFailure(
+                    f"Failed to login (HTTP {res.status_code}), "
+                    + data.get("token", data)
+                )
 
 
 async def Login(
@@ -1,17 +1,44 @@
+import asyncio
 import logging
-from typing import List, Optional, Union
+import time
+from collections import deque
+from typing import (
+    AsyncIterator,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
-from .enums import GameType, Language, Mode, Platform, Reaction, TimeFrame, Title
-from .errors import InvalidTitle
+from .enums import (
+    FeedAction,
+    FriendEvent,
+    GameType,
+    Language,
+    Mode,
+    Platform,
+    Reaction,
+    TimeFrame,
+    Title,
+)
+from .errors import HTTPException, InvalidTitle, NotFound
 from .feed import Blog, FeedItem, Video
-from .leaderboard import Leaderboard
+from .friends import Compendium, FriendUpdate
+from .identity import IdentityIndex, NormalizeUsername, PlayerMap
+from .leaderboard import Leaderboard, LeaderboardEntry
 from .loadout import Loadout, LoadoutItem
-from .loot import Season
+from .loot import LootCatalogue, Season
 from .match import Match
 from .player import Player
 from .squad import Squad, SquadsTournament
 from .stamp import AuthenticityStamp
 from .utils import (
+    AsCompleted,
+    ExpiringCache,
     VerifyGameType,
     VerifyLanguage,
     VerifyMode,
@@ -27,29 +54,91 @@ log: logging.Logger = logging.getLogger(__name__)
 class Client:
     """Client which manages communication with the Call of Duty API."""
 
+    # Number of seconds which localization data is reused before it is
+    # requested again.
+    localizeTTL: int = 3600
+
+    # Number of seconds which the friends compendium is reused before it
+    # is requested again.
+    compendiumTTL: int = 15
+
+    # Number of seconds which a player's loadouts response is reused, so
+    # that loadouts and unlocks requested together share one request.
+    loadoutsTTL: int = 30
+
+    # Number of seconds which a player who was not found is remembered.
+    notFoundTTL: int = 300
+
+    # Number of seconds which a loot catalogue is reused before its seasons
+    # are requested again.
+    lootTTL: int = 3600
+
     def __init__(self, http):
         self.http = http
-
-    async def GetLocalize(self, language: Language = Language.English) -> dict:
+        # The TTLs are read on every lookup, so that changing them on the
+        # Client applies immediately.
+        self.identities: IdentityIndex = IdentityIndex(lambda: self.notFoundTTL)
+        self.players: PlayerMap = PlayerMap(self)
+
+        self._localize: ExpiringCache = ExpiringCache(lambda: self.localizeTTL)
+        self._compendium: ExpiringCache = ExpiringCache(lambda: self.compendiumTTL)
+        self._loadouts: ExpiringCache = ExpiringCache(lambda: self.loadoutsTTL)
+        self._loot: ExpiringCache = ExpiringCache(lambda: self.lootTTL)
+        self._lootCatalogues: Dict[tuple, LootCatalogue] = {}
+
+    async def GetLocalize(
+        self, language: Language = Language.English, **kwargs
+    ) -> dict:
         """
         Get the localized strings used by the Call of Duty Companion App
-        and website.
+        and website. Results are reused for each language until they are
+        older than the Client's localizeTTL.
 
         Parameters
         ----------
         language : callofduty.Language, optional
             Language to use for localization data (default is English.)
+        refresh : bool, optional
+            Boolean indicating whether to ignore previously fetched data (default is False.)
 
         Returns
         -------
         dict
-            JSON data containing localized strings.
+            JSON data containing localized strings. The returned dict is
+            shared between calls and should not be modified.
         """
 
         VerifyLanguage(language)
 
-        web: dict = await self.http.GetWebLocalize(language.value)
-        app: dict = await self.http.GetAppLocalize(language.value)
+        if kwargs.get("refresh", False) is True:
+            self._localize.Invalidate(language)
+
+        return await self._localize.Get(language, lambda: self._FetchLocalize(language))
+
+    async def PrefetchLocalize(self) -> Dict[Language, dict]:
+        """
+        Concurrently get the localized strings for every available language
+        so that subsequent calls to GetLocalize are served without a request.
+
+        Returns
+        -------
+        dict
+            JSON data containing localized strings, keyed by Language.
+        """
+
+        languages: List[Language] = list(Language)
+
+        data: List[dict] = await asyncio.gather(
+            *[self.GetLocalize(language) for language in languages]
+        )
+
+        return dict(zip(languages, data))
+
+    async def _FetchLocalize(self, language: Language) -> dict:
+        web, app = await asyncio.gather(
+            self.http.GetWebLocalize(language.value),
+            self.http.GetAppLocalize(language.value),
+        )
 
         return {**web, **app}
 
@@ -146,6 +235,88 @@ class Client:
 
         return feed
 
+    async def WatchFriendFeed(self, **kwargs) -> AsyncIterator[FeedItem]:
+        """
+        Poll the Friend Feed of the authenticated Call of Duty player,
+        yielding only items which are newer than those already seen.
+
+        Parameters
+        ----------
+        interval : float, optional
+            Number of seconds between polls (default is 60.)
+        buffer : int, optional
+            Number of recently seen items which are remembered (default is 1024.)
+        initial : bool, optional
+            Boolean indicating whether to yield the items present on the
+            first poll (default is False.)
+
+        Returns
+        -------
+        AsyncIterator
+            FeedItem objects, oldest first within each poll.
+        """
+
+        interval: float = kwargs.get("interval", 60)
+        initial: bool = kwargs.get("initial", False)
+        buffer: int = kwargs.get("buffer", 1024)
+
+        if buffer < 1:
+            raise ValueError(f"buffer must be at least 1, not {buffer}")
+
+        # Ring buffer of recently seen item keys, paired with a set for
+        # constant-time membership checks.
+        recent: Deque[tuple] = deque(maxlen=buffer)
+        seen: Set[tuple] = set()
+
+        latest: Optional[int] = None
+
+        while True:
+            try:
+                data: list = (await self.http.GetFriendFeed())["data"]["events"]
+            except HTTPException as e:
+                log.warning(f"Failed to poll friend feed, {e}")
+
+                await asyncio.sleep(interval)
+
+                continue
+
+            # Keys of this poll's items, as a poll may contain duplicates.
+            polled: Set[tuple] = set()
+
+            fresh: List[Tuple[tuple, dict]] = []
+            for _item in data:
+                key: tuple = (_item["date"], _item["username"], _item["category"])
+
+                if (key in seen) or (key in polled):
+                    continue
+                elif (latest is not None) and (key[0] < latest):
+                    continue
+
+                polled.add(key)
+                fresh.append((key, _item))
+
+            fresh.sort(key=lambda f: f[0][0])
+
+            for key, _item in fresh:
+                if len(recent) == recent.maxlen:
+                    seen.discard(recent[0])
+
+                recent.append(key)
+                seen.add(key)
+
+            emit: bool = (latest is not None) or (initial is True)
+
+            if len(fresh) > 0:
+                latest = max(latest or 0, fresh[-1][0][0])
+            elif latest is None:
+                latest = 0
+
+            if emit is True:
+                for _, _item in fresh:
+                    yield FeedItem(self, _item)
+
+            await asyncio.sleep(interval)
+
     async def SetFeedReaction(
         self,
         reaction: Reaction,
@@ -303,6 +474,75 @@ class Client:
 
         await self.http.SetFeedFavorite(0, json)
 
+    async def UpdateFeedItems(
+        self, actions: Iterable[Tuple[FeedItem, Union[Reaction, FeedAction]]], **kwargs
+    ) -> Dict[Tuple[FeedItem, Union[Reaction, FeedAction]], Optional[Exception]]:
+        """
+        Set Reactions and favorites for many Call of Duty Friend Feed items
+        concurrently. When an item is given more than one Reaction, or more
+        than one favorite action, only the last of them is sent.
+
+        Parameters
+        ----------
+        actions : iterable
+            Tuples of FeedItem object and either a Reaction or FeedAction.
+        concurrency : int, optional
+            Maximum number of requests which are performed at once (default is 5.)
+
+        Returns
+        -------
+        dict
+            None for each successful action, or the exception which occured,
+            keyed by the tuple of FeedItem object and action which was sent.
+        """
+
+        bodies: Dict[tuple, dict] = {}
+        latest: Dict[tuple, Tuple[FeedItem, Union[Reaction, FeedAction]]] = {}
+
+        for item, action in actions:
+            if isinstance(action, FeedAction) is False:
+                VerifyReaction(action)
+
+            date: float = item.date.timestamp() * 1000
+            key: tuple = (
+                item.player.platform,
+                item.player.username,
+                item.title,
+                date,
+                item.category,
+            )
+
+            if key not in bodies:
+                VerifyPlatform(item.player.platform)
+                VerifyTitle(item.title)
+
+                bodies[key] = {
+                    "username": item.player.username,
+                    "platform": item.player.platform.value,
+                    "title": item.title.value,
+                    "date": date,
+                    "category": item.category,
+                }
+
+            # Reactions and favorites are independent of one another, so a
+            # later action only replaces an earlier action of the same type.
+            latest[(key, type(action))] = (item, action)
+
+        async def send(target: tuple):
+            key, kind = target
+            item, action = latest[target]
+
+            if kind is FeedAction:
+                await self.http.SetFeedFavorite(
+                    1 if action == FeedAction.Favorite else 0, bodies[key]
+                )
+            else:
+                await self.http.SetFeedReaction(action.value, bodies[key])
+
+        sent: dict = await self._Batch(send, latest, **kwargs)
+
+        return {latest[target]: result for target, result in sent.items()}
+
     async def GetMyIdentities(self) -> list:
         """
         Get the Title Identities for the authenticated Call of Duty player.
@@ -346,13 +586,35 @@ class Client:
 
         for account in data.keys():
             accounts.append(
-                Player(
-                    self, {"platform": account, "username": data[account]["username"]}
+                self.players.Get(
+                    {"platform": account, "username": data[account]["username"]}
                 )
             )
 
         return accounts
 
+    async def GetMyCompendium(self, **kwargs) -> Compendium:
+        """
+        Get the friends compendium of the authenticated Call of Duty player.
+        The compendium is reused until it is older than the Client's
+        compendiumTTL, or until a friend action is performed.
+
+        Parameters
+        ----------
+        refresh : bool, optional
+            Boolean indicating whether to ignore a previously fetched compendium (default is False.)
+
+        Returns
+        -------
+        object
+            Compendium object containing friends and friend requests.
+        """
+
+        if kwargs.get("refresh", False) is True:
+            self._compendium.Invalidate()
+
+        return await self._compendium.Get(None, self._FetchCompendium)
+
     async def GetMyFriends(self) -> List[Player]:
         """
         Get the Friends of the authenticated Call of Duty player.
@@ -363,106 +625,166 @@ class Client:
             Array of Player objects for the friends.
         """
 
-        data: dict = (await self.http.GetMyFriends())["data"]
+        return list((await self.GetMyCompendium()).friends)
 
-        friends: List[Player] = []
+    async def GetMyFriendRequests(self) -> dict:
+        """
+        Get the incoming and outgoing Friend Requests for the authenticated
+        Call of Duty player.
 
-        for friend in data["uno"]:
-            friends.append(
-                Player(
-                    self,
-                    {
-                        "platform": friend["platform"],
-                        "username": friend["username"],
-                        "accountId": friend.get("accountId"),
-                        "online": friend["status"]["online"],
-                    },
-                )
-            )
+        Returns
+        -------
+        dict
+            JSON data of the player's friend requests.
+        """
 
-        for _platform in data["firstParty"]:
-            for friend in data["firstParty"][_platform]:
-                i: list = friend.get("identities", [])
-                identities: List[Player] = []
-
-                for _platform in i:
-                    identities.append(
-                        Player(
-                            self,
-                            {
-                                "platform": friend["identities"][_platform]["platform"],
-                                "username": friend["identities"][_platform].get(
-                                    "username"
-                                ),
-                                "accountId": friend["identities"][_platform][
-                                    "accountId"
-                                ],
-                                "avatarUrl": friend["identities"][_platform].get(
-                                    "avatarUrlLargeSsl"
-                                ),
-                            },
-                        )
+        compendium: Compendium = await self.GetMyCompendium()
+
+        return {
+            "incoming": list(compendium.incoming),
+            "outgoing": list(compendium.outgoing),
+        }
+
+    async def WatchMyFriends(self, **kwargs) -> AsyncIterator[FriendUpdate]:
+        """
+        Poll the Friends of the authenticated Call of Duty player, yielding
+        only the changes between polls. Polling speeds up while friends are
+        changing and slows down while they are not.
+
+        Parameters
+        ----------
+        interval : float, optional
+            Initial number of seconds between polls (default is 30.)
+        minInterval : float, optional
+            Minimum number of seconds between polls (default is 5.)
+        maxInterval : float, optional
+            Maximum number of seconds between polls (default is 300.)
+
+        Returns
+        -------
+        AsyncIterator
+            FriendUpdate objects for friends which were added, removed,
+            came online, went offline, or whose identities changed.
+        """
+
+        minInterval: float = kwargs.get("minInterval", 5)
+        maxInterval: float = kwargs.get("maxInterval", 300)
+        interval: float = min(max(kwargs.get("interval", 30), minInterval), maxInterval)
+
+        previous: Optional[Dict[tuple, Tuple[tuple, dict]]] = None
+
+        while True:
+            try:
+                compendium: Compendium = await self.GetMyCompendium(refresh=True)
+            except HTTPException as e:
+                log.warning(f"Failed to poll friends compendium, {e}")
+
+                interval = maxInterval
+                await asyncio.sleep(interval)
+
+                continue
+
+            # Friends are compared using plain values from the response so
+            # that Player objects are only built for friends which changed.
+            current: Dict[tuple, Tuple[tuple, dict]] = {}
+            for friend in compendium._rawFriends():
+                identities: tuple = tuple(
+                    sorted(
+                        (i["platform"], str(i["accountId"]), i.get("username") or "")
+                        for i in friend.get("identities", {}).values()
                     )
+                )
+
+                key: tuple = (
+                    friend["platform"],
+                    friend.get("accountId") or friend["username"],
+                )
+                state: tuple = (
+                    friend["status"]["online"],
+                    friend["username"],
+                    identities,
+                )
+
+                current[key] = (state, friend)
+
+            changes: int = 0
+
+            if previous is not None:
+                for key, (state, friend) in current.items():
+                    if (old := previous.get(key)) is None:
+                        events: List[FriendEvent] = [FriendEvent.Added]
+                    else:
+                        events: List[FriendEvent] = []
+
+                        if state[0] != old[0][0]:
+                            events.append(
+                                FriendEvent.Online if state[0] else FriendEvent.Offline
+                            )
+
+                        if state[1:] != old[0][1:]:
+                            events.append(FriendEvent.Identities)
 
-                friends.append(
-                    Player(
-                        self,
+                    if len(events) > 0:
+                        player: Player = compendium._buildFriend(friend)
+
+                        for event in events:
+                            changes += 1
+
+                            yield FriendUpdate(
+                                self, {"event": event.value, "player": player}
+                            )
+
+                for key in previous.keys() - current.keys():
+                    friend: dict = previous[key][1]
+
+                    # Only the identifying values are used, so that the stale
+                    # status of a removed friend is not merged into the
+                    # shared Player object.
+                    player: Player = self.players.Get(
                         {
                             "platform": friend["platform"],
                             "username": friend["username"],
                             "accountId": friend.get("accountId"),
-                            "avatarUrl": friend.get("avatarUrlLargeSsl"),
-                            "online": friend["status"]["online"],
-                            "identities": identities,
                         },
                     )
-                )
 
-        return friends
+                    changes += 1
 
-    async def GetMyFriendRequests(self) -> dict:
-        """
-        Get the incoming and outgoing Friend Requests for the authenticated
-        Call of Duty player.
+                    yield FriendUpdate(
+                        self, {"event": FriendEvent.Removed.value, "player": player}
+                    )
 
-        Returns
-        -------
-        dict
-            JSON data of the player's friend requests.
-        """
+                if changes > 0:
+                    interval = max(minInterval, interval / 2)
+                else:
+                    interval = min(maxInterval, interval * 1.5)
 
-        data: dict = (await self.http.GetMyFriends())["data"]
+            previous = current
 
-        incoming: List[Player] = []
-        outgoing: List[Player] = []
+            await asyncio.sleep(interval)
 
-        for request in data["incomingInvitations"]:
-            incoming.append(
-                Player(
-                    self,
-                    {
-                        "platform": request["platform"],
-                        "username": request["username"],
-                        "accountId": request.get("accountId"),
-                        "online": request["status"]["online"],
-                    },
-                )
-            )
+    async def _FetchCompendium(self) -> Compendium:
+        data: dict = (await self.http.GetMyFriends())["data"]
 
-        for request in data["outgoingInvitations"]:
-            outgoing.append(
-                Player(
-                    self,
-                    {
-                        "platform": request["platform"],
-                        "username": request["username"],
-                        "accountId": request.get("accountId"),
-                        "online": request["status"]["online"],
-                    },
+        # The identities are indexed from the plain values of the response
+        # so that the compendium's Player objects may still be built lazily.
+        compendium: Compendium = Compendium(self, data)
+        people: List[dict] = [
+            *compendium._rawFriends(),
+            *data["incomingInvitations"],
+            *data["outgoingInvitations"],
+        ]
+
+        for person in people:
+            for identity in [person, *person.get("identities", {}).values()]:
+                self.identities.Add(
+                    Platform(identity["platform"]),
+                    identity.get("username"),
+                    identity.get("accountId"),
+                    identity.get("avatarUrlLargeSsl"),
                 )
-            )
 
-        return {"incoming": incoming, "outgoing": outgoing}
+        return compendium
 
     async def GetMyFavorites(self) -> List[Player]:
         """
@@ -479,8 +801,7 @@ class Client:
         favorites: List[Player] = []
         for _favorite in data:
             favorites.append(
-                Player(
-                    self,
+                self.players.Get(
                     {
                         "platform": _favorite["friendPlatform"],
                         "username": _favorite["friendUsername"],
@@ -509,7 +830,7 @@ class Client:
 
         VerifyPlatform(platform)
 
-        return Player(self, {"platform": platform.value, "username": username})
+        return self.players.Get({"platform": platform.value, "username": username})
 
     async def SearchPlayers(
         self, platform: Platform, username: str, **kwargs
@@ -559,10 +880,58 @@ class Client:
                 "avatarUrl": avatar,
             }
 
-            results.append(Player(self, data))
+            results.append(self.players.Get(data))
+
+        for player in results:
+            self.identities.AddPlayer(player)
 
         return results
 
+    async def ResolvePlayer(self, platform: Platform, username: str) -> Player:
+        """
+        Get a Call of Duty player, including their account ID and avatar,
+        using their platform and username. Players which have been seen in
+        any previous response are resolved without a request, and players
+        which were recently not found are not searched for again.
+
+        Parameters
+        ----------
+        platform : callofduty.Platform
+            Platform to get the player from.
+        username : str
+            Player's username for the designated platform.
+
+        Returns
+        -------
+        object
+            Player object for the requested player.
+        """
+
+        VerifyPlatform(platform)
+
+        if (identity := self.identities.Get(platform, username)) is None:
+            if self.identities.IsMissing(platform, username) is True:
+                raise NotFound(404, f"{username} ({platform.name}) was not found")
+
+            try:
+                await self.SearchPlayers(platform, username)
+            except NotFound:
+                pass
+
+            if (identity := self.identities.Get(platform, username)) is None:
+                self.identities.SetMissing(platform, username)
+
+                raise NotFound(404, f"{username} ({platform.name}) was not found")
+
+        return self.players.Get(
+            {
+                "platform": platform.value,
+                "username": identity["username"],
+                "accountId": identity["accountId"],
+                "avatarUrl": identity["avatarUrl"],
+            },
+        )
+
     async def GetPlayerProfile(
         self, platform: Platform, username: str, title: Title, mode: Mode
     ) -> dict:
@@ -597,6 +966,46 @@ class Client:
             )
         )["data"]
 
+    async def GetPlayerProfiles(
+        self, players: Iterable[Player], title: Title, mode: Mode, **kwargs
+    ) -> AsyncIterator[Tuple[Player, Union[dict, Exception]]]:
+        """
+        Get the profiles of many Call of Duty players for the specified
+        title and mode, yielding each as soon as it has been received.
+
+        Parameters
+        ----------
+        players : iterable
+            Player objects to get the profiles of.
+        title : callofduty.Title
+            Call of Duty title to get the players' profiles from.
+        mode: callofduty.Mode
+            Call of Duty mode to get the players' profiles from.
+        concurrency : int, optional
+            Maximum number of profiles which are requested at once (default is 10.)
+
+        Returns
+        -------
+        AsyncIterator
+            Tuples containing the Player object and either the JSON data
+            of its profile or the exception which occured while getting it.
+        """
+
+        concurrency: int = kwargs.get("concurrency", 10)
+
+        VerifyTitle(title)
+        VerifyMode(mode, title)
+
+        async def profile(player: Player) -> dict:
+            return (
+                await self.http.GetPlayerProfile(
+                    player.platform.value, player.username, title.value, mode.value
+                )
+            )["data"]
+
+        async for player, result in AsCompleted(profile, players, concurrency):
+            yield (player, result)
+
     async def GetMatch(self, title: Title, platform: Platform, matchId: int) -> Match:
         """
         Get a Call of Duty match using its title, platform, mode, and ID.
@@ -666,7 +1075,7 @@ class Client:
 
     async def GetPlayerMatches(
         self, platform: Platform, username: str, title: Title, mode: Mode, **kwargs
-    ) -> List[Match]:
+    ) -> Union[List[Match], Tuple[List[Match], dict]]:
         """
         Get a Call of Duty player's match history for the specified title and mode.
 
@@ -688,11 +1097,16 @@ class Client:
         endTimestamp : int, optional
             Unix timestamp representing the latest time which a returned
             match should've occured (default is None.)
+        summary : bool, optional
+            Boolean indicating whether to also return the matches summary
+            from the same request (default is False.)
 
         Returns
         -------
         list
-            Array of Match objects.
+            Array of Match objects. If summary is True, a tuple containing
+            the array of Match objects and the JSON data of the matches
+            summary is returned instead.
         """
 
         VerifyPlatform(platform)
@@ -703,70 +1117,22 @@ class Client:
         startTimestamp: int = kwargs.get("startTimestamp", 0)
         endTimestamp: int = kwargs.get("endTimestamp", 0)
 
-        if platform == Platform.Activision:
-            # The preferred matches endpoint does not currently support
-            # the Activision (uno) platform.
-            data: dict = (
-                await self.http.GetPlayerMatchesDetailed(
-                    platform.value,
-                    username,
-                    title.value,
-                    mode.value,
-                    limit,
-                    startTimestamp,
-                    endTimestamp,
-                )
-            )["data"]["matches"]
-
-            matches: List[Match] = []
-
-            for _match in data:
-                matches.append(
-                    Match(
-                        self,
-                        {
-                            # The API returns the matchId as a string
-                            "id": int(_match["matchID"]),
-                            "platform": platform.value,
-                            "title": title.value,
-                        },
-                    )
-                )
-        else:
-            data: dict = (
-                await self.http.GetPlayerMatches(
-                    platform.value,
-                    username,
-                    title.value,
-                    mode.value,
-                    limit,
-                    startTimestamp,
-                    endTimestamp,
-                )
-            )["data"]
-
-            matches: List[Match] = []
-
-            for _match in data:
-                matches.append(
-                    Match(
-                        self,
-                        {
-                            # The API returns the matchId as a string
-                            "id": int(_match["matchId"]),
-                            "platform": platform.value,
-                            "title": title.value,
-                        },
-                    )
-                )
+        if kwargs.get("summary", False) is True:
+            return await self._GetPlayerMatchesDetailed(
+                platform, username, title, mode, limit, startTimestamp, endTimestamp
+            )
 
-        return matches
+        return await self._GetPlayerMatches(
+            platform, username, title, mode, limit, startTimestamp, endTimestamp
+        )
 
-    async def GetPlayerMatchesSummary(
+    async def GetPlayerMatchHistory(
         self, platform: Platform, username: str, title: Title, mode: Mode, **kwargs
-    ) -> dict:
+    ) -> AsyncIterator[Match]:
         """
-        Get a Call of Duty player's match history summary for the specified title and mode.
+        Get a Call of Duty player's entire match history for the specified
+        title and mode, newest first. The requested time window is moved
+        backwards automatically as each page of matches is consumed.
 
         Parameters
         ----------
@@ -779,52 +1145,350 @@ class Client:
         mode: callofduty.Mode
             Call of Duty mode to get the player's matches from.
         limit : int, optional
-            Number of matches which will be returned (default is 10.)
+            Number of matches which are requested per page (default is 20.)
         startTimestamp : int, optional
-            Unix timestamp representing the earliest time which a returned
-            match should've occured (default is None.)
+            Unix timestamp in milliseconds representing the earliest time
+            which a returned match should've occured (default is None.)
         endTimestamp : int, optional
-            Unix timestamp representing the latest time which a returned
-            match should've occured (default is None.)
+            Unix timestamp in milliseconds representing the latest time
+            which a returned match should've occured (default is None.)
 
         Returns
         -------
-        dict
-            JSON data containing recent matches summary.
+        AsyncIterator
+            Match objects, each returned only once.
         """
 
         VerifyPlatform(platform)
         VerifyTitle(title)
         VerifyMode(mode, title)
 
-        limit: int = kwargs.get("limit", 10)
+        limit: int = kwargs.get("limit", 20)
         startTimestamp: int = kwargs.get("startTimestamp", 0)
         endTimestamp: int = kwargs.get("endTimestamp", 0)
 
-        return (
-            await self.http.GetPlayerMatchesDetailed(
-                platform.value,
-                username,
-                title.value,
-                mode.value,
-                limit,
-                startTimestamp,
-                endTimestamp,
+        seen: Set[int] = set()
+
+        while True:
+            matches: List[Match] = await self._GetPlayerMatches(
+                platform, username, title, mode, limit, startTimestamp, endTimestamp
             )
-        )["data"]["summary"]
 
-    async def GetMatchDetails(
-        self, title: Title, platform: Platform, matchId: int
-    ) -> dict:
-        """
-        Get a Call of Duty match's details.
+            fresh: bool = False
+            for match in matches:
+                if match.id in seen:
+                    continue
 
-        Parameters
-        ----------
-        title : callofduty.Title
-            Call of Duty title which the match occured on.
-        platform : callofduty.Platform
-            Platform to get the match from.
+                if (match.timestamp is not None) and (match.timestamp < startTimestamp):
+                    continue
+
+                seen.add(match.id)
+                fresh = True
+
+                yield match
+
+            timestamps: List[int] = [m.timestamp for m in matches if m.timestamp]
+
+            # A partial page means the window has been exhausted.
+            if (len(matches) < limit) or (len(timestamps) == 0):
+                break
+
+            # The window is moved to the oldest match, inclusive, so that
+            # matches which share its timestamp are not skipped. If a page
+            # contains nothing new, step past it to guarantee progress.
+            oldest: int = min(timestamps)
+            endTimestamp = oldest if fresh is True else oldest - 1
+
+            if endTimestamp < startTimestamp:
+                break
+
+    async def GetPlayerMatchesRange(
+        self,
+        platform: Platform,
+        username: str,
+        title: Title,
+        mode: Mode,
+        startTimestamp: int,
+        endTimestamp: int = 0,
+        **kwargs,
+    ) -> List[Match]:
+        """
+        Get every match in a Call of Duty player's history between two
+        timestamps. The interval is split into windows which are requested
+        concurrently, and windows which return a full page are split again.
+
+        Parameters
+        ----------
+        platform : callofduty.Platform
+            Platform to get the player from.
+        username : str
+            Player's username for the designated platform.
+        title : callofduty.Title
+            Call of Duty title to get the player's matches from.
+        mode: callofduty.Mode
+            Call of Duty mode to get the player's matches from.
+        startTimestamp : int
+            Unix timestamp in milliseconds representing the earliest time
+            which a returned match should've occured.
+        endTimestamp : int, optional
+            Unix timestamp in milliseconds representing the latest time
+            which a returned match should've occured (default is now.)
+        partitions : int, optional
+            Number of windows which the interval is initially split into (default is 8.)
+        concurrency : int, optional
+            Maximum number of windows which are requested at once (default is 8.)
+        limit : int, optional
+            Number of matches which are requested per window (default is 20.)
+
+        Returns
+        -------
+        list
+            Array of Match objects, newest first.
+        """
+
+        VerifyPlatform(platform)
+        VerifyTitle(title)
+        VerifyMode(mode, title)
+
+        partitions: int = kwargs.get("partitions", 8)
+        concurrency: int = kwargs.get("concurrency", 8)
+        limit: int = kwargs.get("limit", 20)
+
+        if endTimestamp == 0:
+            endTimestamp = int(time.time() * 1000)
+
+        if startTimestamp <= 0:
+            raise ValueError("startTimestamp is required to partition match history")
+        elif startTimestamp > endTimestamp:
+            raise ValueError("startTimestamp must not be later than endTimestamp")
+        elif (partitions < 1) or (concurrency < 1):
+            raise ValueError("partitions and concurrency must be at least 1")
+
+        windows: Deque[Tuple[int, int]] = deque(
+            self._SplitWindow(startTimestamp, endTimestamp, partitions)
+        )
+        pending: Dict[asyncio.Future, Tuple[int, int]] = {}
+        found: Dict[int, Match] = {}
+
+        try:
+            while windows or pending:
+                while windows and (len(pending) < concurrency):
+                    start, end = windows.popleft()
+
+                    future: asyncio.Future = asyncio.ensure_future(
+                        self._GetPlayerMatches(
+                            platform, username, title, mode, limit, start, end
+                        )
+                    )
+                    pending[future] = (start, end)
+
+                done: Set[asyncio.Future] = (
+                    await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                )[0]
+
+                for future in done:
+                    start, end = pending.pop(future)
+                    matches: List[Match] = future.result()
+
+                    fresh: bool = False
+                    for match in matches:
+                        if match.id not in found:
+                            found[match.id] = match
+                            fresh = True
+
+                    timestamps: List[int] = [
+                        m.timestamp for m in matches if m.timestamp
+                    ]
+
+                    # A full page means the window is dense, so the part
+                    # which was not returned is split and requested again.
+                    if (len(matches) < limit) or (len(timestamps) == 0):
+                        continue
+
+                    oldest: int = min(timestamps)
+                    remaining: int = oldest if fresh is True else oldest - 1
+
+                    if remaining >= start:
+                        windows.extend(self._SplitWindow(start, remaining, 2))
+        finally:
+            for future in pending:
+                future.cancel()
+
+        return sorted(found.values(), key=lambda m: m.timestamp or 0, reverse=True)
+
+    @staticmethod
+    def _SplitWindow(start: int, end: int, parts: int) -> List[Tuple[int, int]]:
+        size: int = max(1, (end - start + 1) // parts)
+        windows: List[Tuple[int, int]] = []
+
+        for i in range(parts):
+            last: int = end if i == parts - 1 else min(end, start + size - 1)
+            windows.append((start, last))
+
+            if (start := last + 1) > end:
+                break
+
+        # Newest windows are requested first.
+        return windows[::-1]
+
+    async def _GetPlayerMatches(
+        self,
+        platform: Platform,
+        username: str,
+        title: Title,
+        mode: Mode,
+        limit: int,
+        startTimestamp: int,
+        endTimestamp: int,
+    ) -> List[Match]:
+        if platform == Platform.Activision:
+            # The preferred matches endpoint does not currently support
+            # the Activision (uno) platform.
+            return (
+                await self._GetPlayerMatchesDetailed(
+                    platform, username, title, mode, limit, startTimestamp, endTimestamp
+                )
+            )[0]
+
+        data: dict = (
+            await self.http.GetPlayerMatches(
+                platform.value,
+                username,
+                title.value,
+                mode.value,
+                limit,
+                startTimestamp,
+                endTimestamp,
+            )
+        )["data"]
+
+        matches: List[Match] = []
+
+        for _match in data:
+            matches.append(
+                Match(
+                    self,
+                    {
+                        # The API returns the matchId as a string
+                        "id": int(_match["matchId"]),
+                        "platform": platform.value,
+                        "title": title.value,
+                        "timestamp": _match.get("timestamp"),
+                        "data": _match,
+                    },
+                )
+            )
+
+        return matches
+
+    async def _GetPlayerMatchesDetailed(
+        self,
+        platform: Platform,
+        username: str,
+        title: Title,
+        mode: Mode,
+        limit: int,
+        startTimestamp: int,
+        endTimestamp: int,
+    ) -> Tuple[List[Match], dict]:
+        data: dict = (
+            await self.http.GetPlayerMatchesDetailed(
+                platform.value,
+                username,
+                title.value,
+                mode.value,
+                limit,
+                startTimestamp,
+                endTimestamp,
+            )
+        )["data"]
+
+        matches: List[Match] = []
+
+        for _match in data["matches"]:
+            started: Optional[int] = _match.get("utcStartSeconds")
+
+            matches.append(
+                Match(
+                    self,
+                    {
+                        # The API returns the matchId as a string
+                        "id": int(_match["matchID"]),
+                        "platform": platform.value,
+                        "title": title.value,
+                        "timestamp": None if started is None else started * 1000,
+                        # The detailed endpoint includes the player's stats
+                        # for each match, so keep them to avoid a request.
+                        "data": _match,
+                    },
+                )
+            )
+
+        return (matches, data.get("summary", {}))
+
+    async def GetPlayerMatchesSummary(
+        self, platform: Platform, username: str, title: Title, mode: Mode, **kwargs
+    ) -> dict:
+        """
+        Get a Call of Duty player's match history summary for the specified title and mode.
+
+        Parameters
+        ----------
+        platform : callofduty.Platform
+            Platform to get the player from.
+        username : str
+            Player's username for the designated platform.
+        title : callofduty.Title
+            Call of Duty title to get the player's matches from.
+        mode: callofduty.Mode
+            Call of Duty mode to get the player's matches from.
+        limit : int, optional
+            Number of matches which will be returned (default is 10.)
+        startTimestamp : int, optional
+            Unix timestamp representing the earliest time which a returned
+            match should've occured (default is None.)
+        endTimestamp : int, optional
+            Unix timestamp representing the latest time which a returned
+            match should've occured (default is None.)
+
+        Returns
+        -------
+        dict
+            JSON data containing recent matches summary.
+        """
+
+        VerifyPlatform(platform)
+        VerifyTitle(title)
+        VerifyMode(mode, title)
+
+        limit: int = kwargs.get("limit", 10)
+        startTimestamp: int = kwargs.get("startTimestamp", 0)
+        endTimestamp: int = kwargs.get("endTimestamp", 0)
+
+        return (
+            await self.http.GetPlayerMatchesDetailed(
+                platform.value,
+                username,
+                title.value,
+                mode.value,
+                limit,
+                startTimestamp,
+                endTimestamp,
+            )
+        )["data"]["summary"]
+
+    async def GetMatchDetails(
+        self, title: Title, platform: Platform, matchId: int
+    ) -> dict:
+        """
+        Get a Call of Duty match's details.
+
+        Parameters
+        ----------
+        title : callofduty.Title
+            Call of Duty title which the match occured on.
+        platform : callofduty.Platform
+            Platform to get the match from.
         matchId : int
             Match ID.
 
@@ -839,6 +1503,78 @@ class Client:
 
         return (await self.http.GetMatch(title.value, platform.value, matchId))["data"]
 
+    async def GetMatchesDetails(
+        self, matches: Iterable[Union[Match, Tuple[Title, Platform, int]]], **kwargs
+    ) -> Dict[int, Union[dict, Exception]]:
+        """
+        Get the details of many Call of Duty matches. Each unique match is
+        only requested once, even if it is passed multiple times.
+
+        Parameters
+        ----------
+        matches : iterable
+            Match objects, or tuples of title, platform, and match ID.
+        concurrency : int, optional
+            Maximum number of matches which are requested at once (default is 8.)
+
+        Returns
+        -------
+        dict
+            JSON data containing the full details of each match, keyed by
+            match ID. A match which could not be requested maps to the
+            exception which occured instead.
+        """
+
+        concurrency: int = kwargs.get("concurrency", 8)
+
+        results: Dict[int, Union[dict, Exception]] = {}
+
+        # Match objects which are passed are given their details so that
+        # later calls to their teams() and details() need no request.
+        unique: Dict[Tuple[Title, Platform, int], List[Match]] = {}
+        for match in matches:
+            if isinstance(match, Match):
+                if match._hasDetails() is True:
+                    results[match.id] = await match.details()
+
+                    continue
+
+                key: Tuple[Title, Platform, int] = (
+                    match.title,
+                    match.platform,
+                    match.id,
+                )
+            else:
+                key: Tuple[Title, Platform, int] = match
+
+            if key not in unique:
+                VerifyTitle(key[0])
+                VerifyPlatform(key[1])
+
+                unique[key] = []
+
+            if isinstance(match, Match):
+                unique[key].append(match)
+
+        async def details(key: Tuple[Title, Platform, int]) -> dict:
+            title, platform, matchId = key
+
+            if matchId in results:
+                return results[matchId]
+
+            return (await self.http.GetMatch(title.value, platform.value, matchId))[
+                "data"
+            ]
+
+        async for key, result in AsCompleted(details, unique, concurrency):
+            results[key[2]] = result
+
+            if not isinstance(result, Exception):
+                for match in unique[key]:
+                    match._setDetails(result)
+
+        return results
+
     async def GetMatchTeams(
         self, title: Title, platform: Platform, matchId: int
     ) -> List[List[Player]]:
@@ -865,22 +1601,22 @@ class Client:
         VerifyPlatform(platform)
         VerifyTitle(title)
 
-        data: dict = (await self.http.GetMatch(title.value, platform.value, matchId))[
-            "data"
-        ]["teams"]
+        return self._MatchTeams(
+            (await self.http.GetMatch(title.value, platform.value, matchId))["data"]
+        )
 
+    def _MatchTeams(self, data: dict) -> List[List[Player]]:
         # The API does not state which team is allies/axis, so no array
         # keys will be used.
         teams: list = []
 
-        for team in data:
+        for team in data["teams"]:
             # Current team iterator
             i: List[Player] = []
 
             for player in team:
                 i.append(
-                    Player(
-                        self,
+                    self.players.Get(
                         {
                             "platform": player["provider"],
                             "username": player["username"],
@@ -889,6 +1625,8 @@ class Client:
                     )
                 )
 
+                self.identities.AddPlayer(i[-1])
+
             teams.append(i)
 
         return teams
@@ -947,6 +1685,97 @@ class Client:
 
         return Leaderboard(self, data)
 
+    async def GetLeaderboardEntries(
+        self, title: Title, platform: Platform, **kwargs
+    ) -> AsyncIterator[LeaderboardEntry]:
+        """
+        Get every entry of a Call of Duty leaderboard, or of a range of its
+        pages, in rank order. Upcoming pages are requested concurrently
+        while the current page is being consumed.
+
+        Parameters
+        ----------
+        title : callofduty.Title
+            Call of Duty title which the leaderboard represents.
+        platform : callofduty.Platform
+            Platform to get which the leaderboard represents.
+        gameType : callofduty.GameType, optional
+            Game type to get the leaderboard for (default is Core.)
+        gameMode : str, optional
+            Game mode to get the leaderboard for (default is Career.)
+        timeFrame : callofduty.TimeFrame, optional
+            Time Frame to get the leaderboard for (default is All-Time.)
+        start : int, optional
+            First leaderboard page to get (default is 1.)
+        end : int, optional
+            Last leaderboard page to get (default is the last page.)
+        window : int, optional
+            Number of pages which are requested ahead of the current page (default is 4.)
+
+        Returns
+        -------
+        AsyncIterator
+            Leaderboard Entry objects. Players who appear on more than one
+            page, as ranks shift between requests, are only returned once.
+        """
+
+        gameType: GameType = kwargs.get("gameType", GameType.Core)
+        gameMode: str = kwargs.get("gameMode", "career")
+        timeFrame: TimeFrame = kwargs.get("timeFrame", TimeFrame.AllTime)
+        start: int = kwargs.get("start", 1)
+        end: Optional[int] = kwargs.get("end")
+        window: int = kwargs.get("window", 4)
+
+        VerifyTitle(title)
+        VerifyPlatform(platform)
+        VerifyGameType(gameType)
+        VerifyTimeFrame(timeFrame)
+
+        if window < 1:
+            raise ValueError(f"window must be at least 1, not {window}")
+
+        def Fetch(page: int) -> asyncio.Future:
+            return asyncio.ensure_future(
+                self.GetLeaderboard(
+                    title,
+                    platform,
+                    gameType=gameType,
+                    gameMode=gameMode,
+                    timeFrame=timeFrame,
+                    page=page,
+                )
+            )
+
+        leaderboard: Leaderboard = await Fetch(start)
+        last: int = leaderboard.pages if end is None else min(end, leaderboard.pages)
+
+        pending: Dict[int, asyncio.Future] = {}
+        seen: Set[str] = set()
+        page: int = start
+
+        try:
+            while True:
+                for upcoming in range(page + 1, min(page + window, last) + 1):
+                    if upcoming not in pending:
+                        pending[upcoming] = Fetch(upcoming)
+
+                for entry in sorted(leaderboard.entries, key=lambda e: e.rank):
+                    if entry.username in seen:
+                        continue
+
+                    seen.add(entry.username)
+
+                    yield entry
+
+                page += 1
+                if page > last:
+                    break
+
+                leaderboard: Leaderboard = await pending.pop(page)
+        finally:
+            for future in pending.values():
+                future.cancel()
+
     async def GetPlayerLeaderboard(
         self, title: Title, platform: Platform, username: str, **kwargs
     ) -> Leaderboard:
@@ -1027,38 +1856,7 @@ class Client:
             Array containing Player objects for each Leaderboard entry.
         """
 
-        gameType: GameType = kwargs.get("gameType", GameType.Core)
-        gameMode: str = kwargs.get("gameMode", "career")
-        timeFrame: TimeFrame = kwargs.get("timeFrame", TimeFrame.AllTime)
-        page: int = kwargs.get("page", 1)
-
-        VerifyTitle(title)
-        VerifyPlatform(platform)
-        VerifyGameType(gameType)
-        VerifyTimeFrame(timeFrame)
-
-        data: dict = (
-            await self.http.GetLeaderboard(
-                title.value,
-                platform.value,
-                gameType.value,
-                gameMode,
-                timeFrame.value,
-                page,
-            )
-        )["data"]
-
-        # Leaderboard responses don't include the timeFrame, so we'll
-        # just add it manually.
-        data["timeFrame"] = timeFrame.value
-
-        players: List[Player] = []
-        for entry in Leaderboard(self, data).entries:
-            players.append(
-                Player(self, {"platform": platform.value, "username": entry.username})
-            )
-
-        return players
+        return await (await self.GetLeaderboard(title, platform, **kwargs)).players()
 
     async def GetAvailableMaps(
         self,
@@ -1115,6 +1913,129 @@ class Client:
         VerifyPlatform(platform)
         VerifyLanguage(language)
 
+        data: dict = await self._FetchLootSeason(title, season, platform, language)
+
+        return Season(self, data)
+
+    async def GetLootCatalogue(self, title: Title, **kwargs) -> LootCatalogue:
+        """
+        Get every Call of Duty Loot Season of a title, indexed by item ID,
+        rarity, category, and tier. Seasons are requested concurrently and
+        the catalogue is reused until it is older than the Client's lootTTL.
+        When it is requested again, only the seasons whose content changed
+        are rebuilt.
+
+        Parameters
+        ----------
+        title : callofduty.Title
+            Call of Duty title which the loot seasons originate.
+        seasons : iterable, optional
+            Loot season numbers to get (default is None, every available season.)
+        platform : callofduty.Platform, optional
+            Platform which the loot seasons are available on (default is PlayStation.)
+        language : callofduty.Language, optional
+            Language which the loot data should be in (default is English.)
+        concurrency : int, optional
+            Maximum number of seasons which are requested at once (default is 5.)
+        refresh : bool, optional
+            Boolean indicating whether to ignore a previously fetched catalogue (default is False.)
+
+        Returns
+        -------
+        object
+            LootCatalogue object for the requested title.
+        """
+
+        platform: Platform = kwargs.get("platform", Platform.PlayStation)
+        language: Language = kwargs.get("language", Language.English)
+        concurrency: int = kwargs.get("concurrency", 5)
+        seasons: Optional[Tuple[int, ...]] = (
+            tuple(sorted(set(_seasons)))
+            if (_seasons := kwargs.get("seasons")) is not None
+            else None
+        )
+
+        VerifyTitle(title)
+        VerifyPlatform(platform)
+        VerifyLanguage(language)
+
+        key: tuple = (title, platform, language, seasons)
+
+        if kwargs.get("refresh", False) is True:
+            self._loot.Invalidate(key)
+
+        return await self._loot.Get(
+            key, lambda: self._FetchLootCatalogue(key, concurrency)
+        )
+
+    async def _FetchLootCatalogue(self, key: tuple, concurrency: int) -> LootCatalogue:
+        title, platform, language, seasons = key
+
+        data: Dict[int, dict] = {}
+
+        async def fetch(season: int) -> dict:
+            return await self._FetchLootSeason(title, season, platform, language)
+
+        if seasons is not None:
+            async for season, result in AsCompleted(fetch, seasons, concurrency):
+                if isinstance(result, Exception):
+                    raise result
+
+                data[season] = result
+        else:
+            # There is no endpoint which lists a title's loot seasons, so
+            # they are requested in consecutive batches until one of them
+            # does not exist. Any other failure is raised, so that a partial
+            # catalogue is never cached.
+            start: int = 1
+            end: Optional[int] = None
+
+            while end is None:
+                batch: range = range(start, start + concurrency)
+
+                async for season, result in AsCompleted(fetch, batch, concurrency):
+                    if self._LootSeasonMissing(result) is True:
+                        end = season if end is None else min(end, season)
+                    elif isinstance(result, Exception):
+                        raise result
+                    else:
+                        data[season] = result
+
+                start += concurrency
+
+            for season in [season for season in data if season > end]:
+                del data[season]
+
+        catalogue: LootCatalogue = LootCatalogue(
+            self,
+            {
+                "title": title.value,
+                "platform": platform.value,
+                "language": language.value,
+                "seasons": data,
+                "previous": self._lootCatalogues.get(key[:3]),
+            },
+        )
+
+        # Only the latest catalogue of each title, platform, and language is
+        # kept, whichever seasons it contains, as its unchanged seasons are
+        # reused by the next one.
+        self._lootCatalogues[key[:3]] = catalogue
+
+        return catalogue
+
+    @staticmethod
+    def _LootSeasonMissing(result: Union[dict, Exception]) -> bool:
+        if isinstance(result, NotFound):
+            return True
+
+        # The API returns HTTP 200 with an error status for seasons which
+        # do not exist.
+        return isinstance(result, HTTPException) and (result.statusCode == 200)
+
+    async def _FetchLootSeason(
+        self, title: Title, season: int, platform: Platform, language: Language
+    ) -> dict:
         data: dict = (
             await self.http.GetLootSeason(
                 title.value, season, platform.value, language.value
@@ -1128,7 +2049,7 @@ class Client:
         data["season"] = season
         data["language"] = language.value
 
-        return Season(self, data)
+        return data
 
     async def GetPlayerLoadouts(
         self, platform: Platform, username: str, title: Title, **kwargs
@@ -1146,6 +2067,8 @@ class Client:
             Call of Duty title to get the player's loadouts from.
         mode: callofduty.Mode, optional
             Call of Duty mode to get the player's loadouts from (default is Multiplayer.)
+        refresh : bool, optional
+            Boolean indicating whether to ignore a previously fetched response (default is False.)
 
         Returns
         -------
@@ -1153,23 +2076,9 @@ class Client:
             Array of loadout objects.
         """
 
-        mode: Mode = kwargs.get("mode", Mode.Multiplayer)
-
-        VerifyPlatform(platform)
-        VerifyTitle(title)
-        VerifyMode(mode, title)
-
-        data: dict = (
-            await self.http.GetPlayerLoadouts(
-                platform.value, username, title.value, mode.value
-            )
-        )["data"]
-
-        loadouts: List[Loadout] = []
-        for _loadout in data["loadouts"]:
-            loadouts.append(Loadout(self, _loadout))
-
-        return loadouts
+        return (
+            await self.GetPlayerLoadoutsAndUnlocks(platform, username, title, **kwargs)
+        )["loadouts"]
 
     async def GetPlayerLoadoutUnlocks(
         self, platform: Platform, username: str, title: Title, **kwargs
@@ -1187,6 +2096,8 @@ class Client:
             Call of Duty title to get the player's loadouts from.
         mode: callofduty.Mode, optional
             Call of Duty mode to get the player's loadouts from (default is Multiplayer.)
+        refresh : bool, optional
+            Boolean indicating whether to ignore a previously fetched response (default is False.)
 
         Returns
         -------
@@ -1194,23 +2105,67 @@ class Client:
             Array of loadout item objects.
         """
 
+        return (
+            await self.GetPlayerLoadoutsAndUnlocks(platform, username, title, **kwargs)
+        )["unlocks"]
+
+    async def GetPlayerLoadoutsAndUnlocks(
+        self, platform: Platform, username: str, title: Title, **kwargs
+    ) -> dict:
+        """
+        Get a Call of Duty player's loadouts and available loadout unlocks
+        for the specified title and mode using a single request. The
+        response is reused for the Client's loadoutsTTL, so requesting
+        loadouts and unlocks separately in quick succession also costs
+        a single request.
+
+        Parameters
+        ----------
+        platform : callofduty.Platform
+            Platform to get the player from.
+        username : str
+            Player's username for the designated platform.
+        title : callofduty.Title
+            Call of Duty title to get the player's loadouts from.
+        mode: callofduty.Mode, optional
+            Call of Duty mode to get the player's loadouts from (default is Multiplayer.)
+        refresh : bool, optional
+            Boolean indicating whether to ignore a previously fetched response (default is False.)
+
+        Returns
+        -------
+        dict
+            Array of loadout objects and array of loadout item objects,
+            keyed by loadouts and unlocks.
+        """
+
         mode: Mode = kwargs.get("mode", Mode.Multiplayer)
 
         VerifyPlatform(platform)
         VerifyTitle(title)
         VerifyMode(mode, title)
 
-        data: dict = (
-            await self.http.GetPlayerLoadouts(
+        key: tuple = (platform, username, title, mode)
+
+        if kwargs.get("refresh", False) is True:
+            self._loadouts.Invalidate(key)
+
+        data: dict = await self._loadouts.Get(
+            key,
+            lambda: self.http.GetPlayerLoadouts(
                 platform.value, username, title.value, mode.value
-            )
-        )["data"]
+            ),
+        )
+
+        loadouts: List[Loadout] = []
+        for _loadout in data["data"]["loadouts"]:
+            loadouts.append(Loadout(self, _loadout))
 
         unlocks: List[LoadoutItem] = []
-        for unlock in data["availableUnlocks"]:
+        for unlock in data["data"]["availableUnlocks"]:
             unlocks.append(LoadoutItem(self, {"id": unlock}))
 
-        return unlocks
+        return {"loadouts": loadouts, "unlocks": unlocks}
 
     async def GetAuthenticityStamp(
         self, platform: Platform, username: str, phrase: str, **kwargs
@@ -1270,7 +2225,11 @@ class Client:
             Status of the Friend Request.
         """
 
-        return (await self.http.AddFriend(accountId))["data"]
+        data: str = (await self.http.AddFriend(accountId))["data"]
+
+        self._compendium.Invalidate()
+
+        return data
 
     async def RemoveFriend(self, accountId: int) -> str:
         """
@@ -1287,7 +2246,11 @@ class Client:
             Status of the Friend Request removal.
         """
 
-        return (await self.http.RemoveFriend(accountId))["data"]
+        data: str = (await self.http.RemoveFriend(accountId))["data"]
+
+        self._compendium.Invalidate()
+
+        return data
 
     async def AddFavorite(self, platform: Platform, username: str) -> List[Player]:
         """
@@ -1311,8 +2274,7 @@ class Client:
         favorites: List[Player] = []
         for _favorite in data:
             favorites.append(
-                Player(
-                    self,
+                self.players.Get(
                     {
                         "platform": _favorite["friendPlatform"],
                         "username": _favorite["friendUsername"],
@@ -1344,8 +2306,7 @@ class Client:
         favorites: List[Player] = []
         for _favorite in data:
             favorites.append(
-                Player(
-                    self,
+                self.players.Get(
                     {
                         "platform": _favorite["friendPlatform"],
                         "username": _favorite["friendUsername"],
@@ -1371,6 +2332,8 @@ class Client:
 
         await self.http.BlockPlayer(accountId)
 
+        self._compendium.Invalidate()
+
     async def UnblockPlayer(self, accountId: int) -> None:
         """
         Unblock communications to and from the specified Activision ID.
@@ -1387,6 +2350,174 @@ class Client:
 
         await self.http.UnblockPlayer(accountId)
 
+        self._compendium.Invalidate()
+
+    async def AddFriends(
+        self, accountIds: Iterable[int], **kwargs
+    ) -> Dict[int, Union[str, Exception]]:
+        """
+        Send Friend Requests to many Activision IDs concurrently.
+
+        Parameters
+        ----------
+        accountIds : iterable
+            Account IDs for the players' Activision IDs.
+        concurrency : int, optional
+            Maximum number of requests which are performed at once (default is 5.)
+
+        Returns
+        -------
+        dict
+            Status of each Friend Request, or the exception which occured,
+            keyed by account ID.
+        """
+
+        return await self._Batch(self.AddFriend, accountIds, **kwargs)
+
+    async def RemoveFriends(
+        self, accountIds: Iterable[int], **kwargs
+    ) -> Dict[int, Union[str, Exception]]:
+        """
+        Remove Friends or Friend Requests to many Activision IDs concurrently.
+
+        Parameters
+        ----------
+        accountIds : iterable
+            Account IDs for the players' Activision IDs.
+        concurrency : int, optional
+            Maximum number of requests which are performed at once (default is 5.)
+
+        Returns
+        -------
+        dict
+            Status of each Friend Request removal, or the exception which
+            occured, keyed by account ID.
+        """
+
+        return await self._Batch(self.RemoveFriend, accountIds, **kwargs)
+
+    async def AddFavorites(
+        self, players: Iterable[Tuple[Platform, str]], **kwargs
+    ) -> Dict[Tuple[Platform, str], Union[List[Player], Exception]]:
+        """
+        Set many Players as Favorite Friends concurrently.
+
+        Parameters
+        ----------
+        players : iterable
+            Tuples of platform and username for each player.
+        concurrency : int, optional
+            Maximum number of requests which are performed at once (default is 5.)
+
+        Returns
+        -------
+        dict
+            Array of Player objects of all Favorite Friends after each
+            request, or the exception which occured, keyed by player.
+        """
+
+        return await self._Batch(
+            lambda player: self.AddFavorite(*player),
+            self._UniquePlayers(players),
+            **kwargs,
+        )
+
+    async def RemoveFavorites(
+        self, players: Iterable[Tuple[Platform, str]], **kwargs
+    ) -> Dict[Tuple[Platform, str], Union[List[Player], Exception]]:
+        """
+        Remove many Players as Favorite Friends concurrently.
+
+        Parameters
+        ----------
+        players : iterable
+            Tuples of platform and username for each player.
+        concurrency : int, optional
+            Maximum number of requests which are performed at once (default is 5.)
+
+        Returns
+        -------
+        dict
+            Array of Player objects of all Favorite Friends after each
+            request, or the exception which occured, keyed by player.
+        """
+
+        return await self._Batch(
+            lambda player: self.RemoveFavorite(*player),
+            self._UniquePlayers(players),
+            **kwargs,
+        )
+
+    async def BlockPlayers(
+        self, accountIds: Iterable[int], **kwargs
+    ) -> Dict[int, Optional[Exception]]:
+        """
+        Block communications to and from many Activision IDs concurrently.
+
+        Parameters
+        ----------
+        accountIds : iterable
+            Account IDs for the players' Activision IDs.
+        concurrency : int, optional
+            Maximum number of requests which are performed at once (default is 5.)
+
+        Returns
+        -------
+        dict
+            None for each successful request, or the exception which
+            occured, keyed by account ID.
+        """
+
+        return await self._Batch(self.BlockPlayer, accountIds, **kwargs)
+
+    async def UnblockPlayers(
+        self, accountIds: Iterable[int], **kwargs
+    ) -> Dict[int, Optional[Exception]]:
+        """
+        Unblock communications to and from many Activision IDs concurrently.
+
+        Parameters
+        ----------
+        accountIds : iterable
+            Account IDs for the players' Activision IDs.
+        concurrency : int, optional
+            Maximum number of requests which are performed at once (default is 5.)
+
+        Returns
+        -------
+        dict
+            None for each successful request, or the exception which
+            occured, keyed by account ID.
+        """
+
+        return await self._Batch(self.UnblockPlayer, accountIds, **kwargs)
+
+    async def _Batch(self, action, targets: Iterable, **kwargs) -> dict:
+        concurrency: int = kwargs.get("concurrency", 5)
+
+        results: dict = {}
+        async for target, result in AsCompleted(
+            action, dict.fromkeys(targets), concurrency
+        ):
+            results[target] = result
+
+        return results
+
+    @staticmethod
+    def _UniquePlayers(
+        players: Iterable[Tuple[Platform, str]],
+    ) -> List[Tuple[Platform, str]]:
+        unique: Dict[Tuple[Platform, str], Tuple[Platform, str]] = {}
+
+        for platform, username in players:
+            VerifyPlatform(platform)
+
+            unique.setdefault(
+                (platform, NormalizeUsername(username)), (platform, username)
+            )
+
+        return list(unique.values())
+
     async def GetSquad(self, name: str) -> Squad:
         """
         Get a Call of Duty Squad using its name.
@@ -53,3 +53,16 @@ class Reaction(Enum):
     Shocked = "shock"
     FistBump = "congrats"
     Remove = "none"
+
+
+class FeedAction(Enum):
+    Favorite = "favorite"
+    Unfavorite = "unfavorite"
+
+
+class FriendEvent(Enum):
+    Added = "added"
+    Removed = "removed"
+    Online = "online"
+    Offline = "offline"
+    Identities = "identities"
@@ -98,6 +98,9 @@ class HTTPException(CallofDutyException):
     """
 
     def __init__(self, statusCode: int, res: Union[dict, list, str]):
+        self.statusCode: int = statusCode
+        self.res: Union[dict, list, str] = res
+
         if isinstance(res, dict):
             try:
                 message: Union[dict, list, str] = res["data"].get("message", res)
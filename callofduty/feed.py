@@ -1,10 +1,11 @@
 import logging
+import sys
 from datetime import datetime
 from typing import List, Optional
 
 from .enums import Reaction, Title
 from .match import Match
-from .object import Object
+from .object import Field, Lazy, Object
 from .player import Player
 from .utils import StripHTML
 
@@ -37,25 +38,45 @@ class FeedItem(Object):
 
     _type: str = "FeedItem"
 
-    def __init__(self, client, data: dict):
-        super().__init__(client)
+    __slots__ = (
+        "_player",
+        "_title",
+        "_match",
+        "_category",
+        "_date",
+        "_html",
+        "_text",
+        "_favorited",
+    )
+
+    title: Title = Field(convert=Title)
+    category: str = Field(convert=sys.intern)
+    html: str = Field("rendered")
+    favorited: bool = Field()
+
+    @Lazy
+    def player(self) -> Player:
+        return self._client.players.Get(
+            {"platform": self._raw["platform"], "username": self._raw["username"]}
+        )
+
+    @Lazy
+    def match(self) -> Optional[Match]:
+        if (_matchId := self._raw["meta"].get("matchId")) is None:
+            return None
 
-        self.player: Player = Player(
-            self, {"platform": data.pop("platform"), "username": data.pop("username")}
+        return Match(
+            self._client,
+            {"id": _matchId, "platform": self.player.platform, "title": self.title},
         )
-        self.title: Title = Title(data.pop("title"))
-        self.match: Optional[Match] = None
-        self.category: str = data.pop("category")
-        self.date: datetime = datetime.fromtimestamp((data.pop("date") / 1000))
-        self.html: str = data.pop("rendered")
-        self.text: str = StripHTML(self.html)
-        self.favorited: bool = data.pop("favorited")
-
-        if (_matchId := data["meta"].get("matchId")) is not None:
-            self.match: Optional[Match] = Match(
-                client,
-                {"id": _matchId, "platform": self.player.platform, "title": self.title},
-            )
+
+    @Lazy
+    def date(self) -> datetime:
+        return datetime.fromtimestamp((self._raw["date"] / 1000))
+
+    @Lazy
+    def text(self) -> str:
+        return StripHTML(self.html)
 
     async def react(self, reaction: Reaction) -> None:
         """
@@ -160,26 +181,42 @@ class Blog(Object):
 
     _type: str = "Blog"
 
-    def __init__(self, client, data: dict):
-        super().__init__(client)
-
-        self.author: Optional[str] = data.pop("author", None)
-        self.title: str = data.pop("title")
-        self.subtitle: Optional[str] = data.pop("subTitle", None)
-        self.html: Optional[str] = data.pop("html", None)
-        self.text: Optional[str] = (
-            StripHTML(self.html) if self.html is not None else None
-        )
-        self.url: str = data.pop("url")
-        self.thumbnail: str = data.pop("dimg")
-        self.category: Optional[str] = data["metadata"].pop("contentItemType", None)
-        self.published: datetime = datetime(
-            data["publishedDate"].pop("year"),
-            data["publishedDate"].pop("month"),
-            data["publishedDate"].pop("dayOfMonth"),
-            data["publishedDate"].pop("hourOfDay"),
-            data["publishedDate"].pop("minute"),
-            data["publishedDate"].pop("second"),
+    __slots__ = (
+        "_author",
+        "_title",
+        "_subtitle",
+        "_html",
+        "_text",
+        "_url",
+        "_thumbnail",
+        "_category",
+        "_published",
+    )
+
+    author: Optional[str] = Field(default=None)
+    title: str = Field()
+    subtitle: Optional[str] = Field("subTitle", default=None)
+    html: Optional[str] = Field(default=None)
+    url: str = Field()
+    thumbnail: str = Field("dimg")
+
+    @Lazy
+    def text(self) -> Optional[str]:
+        return StripHTML(self.html) if self.html is not None else None
+
+    @Lazy
+    def category(self) -> Optional[str]:
+        return self._raw["metadata"].get("contentItemType")
+
+    @Lazy
+    def published(self) -> datetime:
+        return datetime(
+            self._raw["publishedDate"]["year"],
+            self._raw["publishedDate"]["month"],
+            self._raw["publishedDate"]["dayOfMonth"],
+            self._raw["publishedDate"]["hourOfDay"],
+            self._raw["publishedDate"]["minute"],
+            self._raw["publishedDate"]["second"],
         )
 
 
@@ -205,12 +242,21 @@ class Video(Object):
 
     _type: str = "Video"
 
-    def __init__(self, client, data: dict):
-        super().__init__(client)
-
-        self.title: str = data.pop("title")
-        self.description: str = data.pop("description")
-        self.url: str = "https://youtu.be/" + data.pop("youtubeId")
-        self.length: str = data.pop("length")
-        self.thumbnail: str = data.pop("image")
-        self.categories: List[str] = data.pop("categories")
+    __slots__ = (
+        "_title",
+        "_description",
+        "_url",
+        "_length",
+        "_thumbnail",
+        "_categories",
+    )
+
+    title: str = Field()
+    description: str = Field()
+    length: str = Field()
+    thumbnail: str = Field("image")
+    categories: List[str] = Field()
+
+    @Lazy
+    def url(self) -> str:
+        return "https://youtu.be/" + self._raw["youtubeId"]
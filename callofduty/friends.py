@@ -0,0 +1,127 @@
+import logging
+from typing import Iterator, List
+
+from .enums import FriendEvent
+from .object import Field, Lazy, Object
+from .player import Player
+
+log: logging.Logger = logging.getLogger(__name__)
+
+
+class Compendium(Object):
+    """
+    Represents a snapshot of the authenticated Call of Duty player's
+    friends compendium. Each collection is only built when it is first
+    accessed.
+
+    Parameters
+    ----------
+    friends : list
+        Array of Player objects for the friends.
+    incoming : list
+        Array of Player objects for the incoming Friend Requests.
+    outgoing : list
+        Array of Player objects for the outgoing Friend Requests.
+    data : dict
+        JSON data of the friends compendium.
+    """
+
+    _type: str = "Compendium"
+
+    __slots__ = ("_friends", "_incoming", "_outgoing")
+
+    @property
+    def data(self) -> dict:
+        return self._raw
+
+    @Lazy
+    def friends(self) -> List[Player]:
+        return self._buildFriends()
+
+    @Lazy
+    def incoming(self) -> List[Player]:
+        return self._buildInvitations("incomingInvitations")
+
+    @Lazy
+    def outgoing(self) -> List[Player]:
+        return self._buildInvitations("outgoingInvitations")
+
+    def _buildFriends(self) -> List[Player]:
+        friends: List[Player] = []
+
+        for friend in self._rawFriends():
+            friends.append(self._buildFriend(friend))
+
+        return friends
+
+    def _rawFriends(self) -> Iterator[dict]:
+        yield from self.data["uno"]
+
+        for _platform in self.data["firstParty"]:
+            yield from self.data["firstParty"][_platform]
+
+    def _buildFriend(self, friend: dict) -> Player:
+        return self._client.players.Get(
+            {
+                "platform": friend["platform"],
+                "username": friend["username"],
+                "accountId": friend.get("accountId"),
+                "avatarUrl": friend.get("avatarUrlLargeSsl"),
+                "online": friend["status"]["online"],
+                "identities": self._buildIdentities(friend),
+            },
+        )
+
+    def _buildIdentities(self, friend: dict) -> List[Player]:
+        identities: List[Player] = []
+
+        for identity in friend.get("identities", {}).values():
+            identities.append(
+                self._client.players.Get(
+                    {
+                        "platform": identity["platform"],
+                        "username": identity.get("username"),
+                        "accountId": identity["accountId"],
+                        "avatarUrl": identity.get("avatarUrlLargeSsl"),
+                    },
+                )
+            )
+
+        return identities
+
+    def _buildInvitations(self, key: str) -> List[Player]:
+        invitations: List[Player] = []
+
+        for request in self.data[key]:
+            invitations.append(
+                self._client.players.Get(
+                    {
+                        "platform": request["platform"],
+                        "username": request["username"],
+                        "accountId": request.get("accountId"),
+                        "online": request["status"]["online"],
+                    },
+                )
+            )
+
+        return invitations
+
+
+class FriendUpdate(Object):
+    """
+    Represents a change to one of the authenticated Call of Duty player's friends.
+
+    Parameters
+    ----------
+    event : callofduty.FriendEvent
+        Kind of change which occured.
+    player : callofduty.Player
+        Player object for the friend, as of the change.
+    """
+
+    _type: str = "FriendUpdate"
+
+    __slots__ = ("_event", "_player")
+
+    event: FriendEvent = Field(convert=FriendEvent)
+    player: Player = Field()
@@ -1,4 +1,6 @@
+import asyncio
 import logging
+import random
 import urllib.parse
 from typing import Dict, List, Optional, Union
 
@@ -32,6 +34,30 @@ async def JSONorText(res: Response) -> Union[dict, list, str]:
         return res.text
 
 
+def RetryAfter(res: Response, default: float) -> float:
+    """
+    Determine how long to wait before retrying a rate limited request.
+
+    Parameters
+    ----------
+    res : httpx.Response
+        Response object of the rate limited request.
+    default : float
+        Number of seconds to wait if the response does not specify.
+
+    Returns
+    -------
+    float
+        Number of seconds to wait before retrying.
+    """
+
+    try:
+        return max(0.0, float(res.headers.get("Retry-After", default)))
+    except ValueError:
+        # Retry-After may also be an HTTP date, which is not worth parsing.
+        return default
+
+
 class Request:
     """
     Represents a Request object.
@@ -77,6 +103,13 @@ class Request:
 class HTTP:
     """HTTP client used to communicate with the Call of Duty API."""
 
+    # Number of times a rate limited request is retried before failing.
+    retries: int = 3
+
+    # Maximum number of seconds which is waited before a retry, regardless
+    # of the Retry-After header.
+    maxRetryDelay: float = 30
+
     def __init__(self, auth):
         self.auth = auth
         self.session: AsyncClient = auth.session
@@ -99,41 +132,57 @@ class HTTP:
         req.SetHeader("Authorization", f"Bearer {self.auth.AccessToken}")
         req.SetHeader("x_cod_device_id", self.auth.DeviceId)
 
-        async with self.session as client:
-            res: Response = await client.request(
+        for attempt in range(self.retries + 1):
+            # The session is shared by every request and must remain open, so
+            # it is not used as a context manager here. This allows multiple
+            # requests to be performed concurrently.
+            res: Response = await self.session.request(
                 req.method, req.url, headers=req.headers, json=req.json
             )
 
-            data: Union[dict, list, str] = await JSONorText(res)
-            if isinstance(data, dict):
-                status: Optional[str] = data.get("status")
+            if (res.status_code != 429) or (attempt == self.retries):
+                break
 
-                # The API tends to return HTTP 200 even when an error occurs
-                if status == "error":
-                    raise HTTPException(res.status_code, data)
+            # Jitter prevents concurrent requests which were rate limited
+            # together from all retrying at the same moment.
+            delay: float = min(
+                self.maxRetryDelay,
+                RetryAfter(res, 2 ** attempt) * random.uniform(1, 1.25),
+            )
+            log.debug(f"Rate limited, retrying {req.url} in {delay}s")
 
-            # HTTP 2XX: Success
-            if 300 > res.status_code >= 200:
-                return data
+            await asyncio.sleep(delay)
 
-            # HTTP 429: Too Many Requests
-            if res.status_code == 429:
-                # TODO Handle rate limiting
-                raise HTTPException(res.status_code, data)
+        data: Union[dict, list, str] = await JSONorText(res)
+        if isinstance(data, dict):
+            status: Optional[str] = data.get("status")
 
-            # HTTP 500/502: Internal Server Error/Bad Gateway
-            if res.status_code == 500 or res.status_code == 502:
-                # TODO Handle Unconditional retries
+            # The API tends to return HTTP 200 even when an error occurs
+            if status == "error":
                 raise HTTPException(res.status_code, data)
 
-            # HTTP 403: Forbidden
-            if res.status_code == 403:
-                raise Forbidden(res.status_code, data)
-            # HTTP 404: Not Found
-            elif res.status_code == 404:
-                raise NotFound(res.status_code, data)
-            else:
-                raise HTTPException(res.status_code, data)
+        # HTTP 2XX: Success
+        if 300 > res.status_code >= 200:
+            return data
+
+        # HTTP 429: Too Many Requests
+        if res.status_code == 429:
+            # Rate limited requests have already been retried above
+            raise HTTPException(res.status_code, data)
+
+        # HTTP 500/502: Internal Server Error/Bad Gateway
+        if res.status_code == 500 or res.status_code == 502:
+            # TODO Handle Unconditional retries
+            raise HTTPException(res.status_code, data)
+
+        # HTTP 403: Forbidden
+        if res.status_code == 403:
+            raise Forbidden(res.status_code, data)
+        # HTTP 404: Not Found
+        elif res.status_code == 404:
+            raise NotFound(res.status_code, data)
+        else:
+            raise HTTPException(res.status_code, data)
 
     async def GetAppLocalize(self, language: str) -> Union[dict, list, str]:
         return await self.Send(
@@ -0,0 +1,282 @@
+import logging
+import time
+import weakref
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple, Union
+
+from .enums import Platform
+from .player import Player
+
+log: logging.Logger = logging.getLogger(__name__)
+
+
+def NormalizeUsername(username: str) -> str:
+    """
+    Normalize a username so that lookups are case-insensitive.
+
+    Parameters
+    ----------
+    username : str
+        Player's username for any platform.
+
+    Returns
+    -------
+    str
+        Normalized username.
+    """
+
+    return username.strip().casefold()
+
+
+class IdentityIndex:
+    """
+    Local index which maps players' platform and username to their account
+    ID and avatar. Usernames which are known not to exist are also
+    remembered for a limited time. The least recently used players are
+    evicted once the index is full.
+
+    Parameters
+    ----------
+    ttl : float or callable, optional
+        Number of seconds which a missing username is remembered, or a
+        function which returns it (default is 300.)
+    size : int, optional
+        Maximum number of players, and of missing usernames, which are
+        remembered (default is 10000.)
+    """
+
+    def __init__(self, ttl: Union[float, Callable[[], float]] = 300, size: int = 10000):
+        self.ttl: Union[float, Callable[[], float]] = ttl
+        self.size: int = size
+
+        self._players: OrderedDict[Tuple[Platform, str], dict] = OrderedDict()
+        self._missing: OrderedDict[Tuple[Platform, str], float] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._players)
+
+    def Add(
+        self,
+        platform: Platform,
+        username: Optional[str],
+        accountId: Optional[int] = None,
+        avatarUrl: Optional[str] = None,
+    ):
+        """
+        Add or update the identity of a player. Values which are None do
+        not overwrite values which are already known.
+
+        Parameters
+        ----------
+        platform : callofduty.Platform
+            Platform of the player.
+        username : str
+            Player's username for the designated platform.
+        accountId : int, optional
+            Account ID for the player's designated platform (default is None.)
+        avatarUrl : str, optional
+            Url which returns an image of the player's avatar (default is None.)
+        """
+
+        if username is None:
+            return
+
+        key: Tuple[Platform, str] = (platform, NormalizeUsername(username))
+
+        self._missing.pop(key, None)
+
+        entry: dict = self._players.setdefault(
+            key, {"username": username, "accountId": None, "avatarUrl": None}
+        )
+        entry["username"] = username
+
+        self._players.move_to_end(key)
+        if len(self._players) > self.size:
+            self._players.popitem(last=False)
+
+        if accountId is not None:
+            # The API returns the accountId as a string in some responses
+            entry["accountId"] = int(accountId)
+
+        if avatarUrl is not None:
+            entry["avatarUrl"] = avatarUrl
+
+    def AddPlayer(self, player):
+        """
+        Add or update the identity of a player, and its identities, using
+        a Player object.
+
+        Parameters
+        ----------
+        player : callofduty.Player
+            Player object to add to the index.
+        """
+
+        self.Add(player.platform, player.username, player.accountId, player.avatarUrl)
+
+        for identity in player.identities:
+            self.AddPlayer(identity)
+
+    def Get(self, platform: Platform, username: str) -> Optional[dict]:
+        """
+        Get the identity of a player using their platform and username.
+
+        Parameters
+        ----------
+        platform : callofduty.Platform
+            Platform of the player.
+        username : str
+            Player's username for the designated platform.
+
+        Returns
+        -------
+        dict
+            JSON data containing the username, accountId, and avatarUrl,
+            or None if the player is not indexed.
+        """
+
+        key: Tuple[Platform, str] = (platform, NormalizeUsername(username))
+
+        if (entry := self._players.get(key)) is not None:
+            self._players.move_to_end(key)
+
+        return entry
+
+    def SetMissing(self, platform: Platform, username: str):
+        """
+        Remember that a player does not exist for the index's ttl.
+
+        Parameters
+        ----------
+        platform : callofduty.Platform
+            Platform of the player.
+        username : str
+            Player's username for the designated platform.
+        """
+
+        key: Tuple[Platform, str] = (platform, NormalizeUsername(username))
+
+        self._missing[key] = time.monotonic()
+
+        self._missing.move_to_end(key)
+        if len(self._missing) > self.size:
+            self._missing.popitem(last=False)
+
+    def IsMissing(self, platform: Platform, username: str) -> bool:
+        """
+        Determine whether a player is known not to exist.
+
+        Parameters
+        ----------
+        platform : callofduty.Platform
+            Platform of the player.
+        username : str
+            Player's username for the designated platform.
+
+        Returns
+        -------
+        bool
+            Boolean indicating whether the player was recently not found.
+        """
+
+        key: Tuple[Platform, str] = (platform, NormalizeUsername(username))
+
+        ttl: float = self.ttl() if callable(self.ttl) else self.ttl
+
+        if (stored := self._missing.get(key)) is None:
+            return False
+        elif time.monotonic() - stored >= ttl:
+            del self._missing[key]
+
+            return False
+
+        return True
+
+
+class PlayerMap:
+    """
+    Identity map which returns a single Player object for each player, so
+    that every response which includes the player shares one object, and
+    values learned from one response, such as the account ID, are visible
+    through all of them. Players are weakly referenced, and are removed
+    from the map once nothing else uses them.
+
+    Parameters
+    ----------
+    client : callofduty.Client
+        Client which manages communication with the Call of Duty API.
+    """
+
+    def __init__(self, client):
+        self.client = client
+
+        self._usernames: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+        self._accounts: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
+    def __len__(self) -> int:
+        players: list = [*self._usernames.values(), *self._accounts.values()]
+
+        return len({id(player) for player in players})
+
+    def Get(self, data: dict, **kwargs) -> Player:
+        """
+        Get the Player object for a player, creating it if it is not already
+        mapped. Values in the data which are not None are merged into an
+        existing Player object.
+
+        Parameters
+        ----------
+        data : dict
+            JSON data of the player, containing the platform and username
+            or account ID, and optionally avatarUrl, online, and identities.
+        overwrite : bool, optional
+            Boolean indicating whether values of an existing Player object
+            are overwritten, rather than only filled in where they are
+            unknown (default is True.)
+
+        Returns
+        -------
+        object
+            Player object which is shared by every view of the player.
+        """
+
+        platform: Platform = Platform(data["platform"])
+        username: Optional[str] = data.get("username")
+        accountId: Optional[int] = data.get("accountId")
+
+        player: Optional[Player] = None
+
+        if username is not None:
+            player = self._usernames.get((platform, NormalizeUsername(username)))
+
+        if (player is None) and (accountId is not None):
+            player = self._accounts.get((platform, str(accountId)))
+
+        if player is None:
+            player = Player(self.client, data)
+        else:
+            self._Merge(player, data, kwargs.get("overwrite", True))
+
+        if player.username is not None:
+            self._usernames[(platform, NormalizeUsername(player.username))] = player
+
+        if player.accountId is not None:
+            self._accounts[(platform, str(player.accountId))] = player
+
+        return player
+
+    @staticmethod
+    def _Merge(player: Player, data: dict, overwrite: bool):
+        # Values which are missing from a response do not overwrite values
+        # which were learned from another one.
+        for key in ("username", "accountId", "avatarUrl", "online"):
+            if data.get(key) is None:
+                continue
+
+            # Online is always known, so it is never filled in.
+            if (overwrite is True) or (getattr(player, key) is None):
+                setattr(player, key, data[key])
+
+        if len(data.get("identities", [])) > 0:
+            if (overwrite is True) or (len(player.identities) == 0):
+                player.identities = data["identities"]
@@ -1,8 +1,17 @@
+import array
+import heapq
 import logging
-from typing import Dict, List, Union
+import math
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
 
 from .enums import GameType, Platform, TimeFrame, Title
-from .object import Object
+from .object import Field, Lazy, Object
+from .player import Player
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 log: logging.Logger = logging.getLogger(__name__)
 
@@ -35,29 +44,57 @@ class Leaderboard(Object):
 
     _type: str = "Leaderboard"
 
-    def __init__(self, client, data: dict):
-        super().__init__(client)
+    __slots__ = (
+        "_title",
+        "_platform",
+        "_gameType",
+        "_gameMode",
+        "_timeFrame",
+        "_page",
+        "_pages",
+        "_columns",
+        "_entries",
+    )
+
+    title: Title = Field(convert=Title)
+    platform: Platform = Field(convert=Platform)
+    gameType: GameType = Field("leaderboardType", GameType)
+    gameMode: str = Field()
+    timeFrame: TimeFrame = Field(convert=TimeFrame)
+    page: int = Field()
+    pages: int = Field("totalPages")
+    columns: list = Field()
 
-        self.title: Title = Title(data.pop("title"))
-        self.platform: Platform = Platform(data.pop("platform"))
-        self.gameType: GameType = GameType(data.pop("leaderboardType"))
-        self.gameMode: str = data.pop("gameMode")
-        self.timeFrame: TimeFrame = TimeFrame(data.pop("timeFrame"))
-        self.page: int = data.pop("page")
-        self.pages: int = data.pop("totalPages")
-        self.columns: list = data.pop("columns")
-        self.entries: List[LeaderboardEntry] = []
+    @Lazy
+    def entries(self) -> List["LeaderboardEntry"]:
+        entries: List[LeaderboardEntry] = []
 
-        for entry in data.pop("entries", []):
-            # Leaderboard Entries don't include this value, so we'll just
-            # add it manually.
-            entry["platform"] = self.platform.value
+        for entry in self._raw.get("entries", []):
+            # The entries are given the Client rather than the leaderboard,
+            # so that they do not keep the leaderboard's raw data alive.
+            entries.append(
+                LeaderboardEntry(self._client, entry, platform=self.platform)
+            )
 
-            self.entries.append(LeaderboardEntry(self, entry))
+        return entries
 
-    async def players(self) -> list:
+    def columnar(self) -> "LeaderboardColumns":
         """
-        Get the players from a Call of Duty leaderboard.
+        Get a columnar view of the leaderboard's entries, which is built
+        directly from the raw data without creating LeaderboardEntry objects.
+
+        Returns
+        -------
+        object
+            LeaderboardColumns object containing the leaderboard's entries.
+        """
+
+        return LeaderboardColumns.fromLeaderboards([self])
+
+    async def players(self) -> List[Player]:
+        """
+        Get the players from a Call of Duty leaderboard. The players are
+        built from the leaderboard's entries, so no request is made.
 
         Returns
         -------
@@ -65,14 +102,15 @@ class Leaderboard(Object):
             Array of Player objects for each leaderboard entry.
         """
 
-        return await self._client.GetLeaderboardPlayers(
-            self.title,
-            self.platform,
-            gameType=self.gameType,
-            gameMode=self.gameMode,
-            timeFrame=self.timeFrame,
-            page=self.page,
-        )
+        players: List[Player] = []
+        for entry in self.entries:
+            players.append(
+                self._client.players.Get(
+                    {"platform": entry.platform.value, "username": entry.username},
+                )
+            )
+
+        return players
 
 
 class LeaderboardEntry(Object):
@@ -97,12 +135,313 @@ class LeaderboardEntry(Object):
 
     _type: str = "LeaderboardEntry"
 
-    def __init__(self, client, data: dict):
-        super().__init__(client)
+    _compact: bool = True
+
+    __slots__ = (
+        "_platform",
+        "_username",
+        "_rank",
+        "_updated",
+        "_rating",
+        "_values",
+        "_leaderboardPlatform",
+    )
+
+    username: str = Field()
+    rank: int = Field(convert=int)
+    updated: int = Field("updateTime", int)
+    rating: int = Field()
+    values: Dict[str, Union[int, float]] = Field()
+
+    def __init__(self, client, data: dict, **kwargs):
+        super().__init__(client, data)
+
+        self._leaderboardPlatform: Optional[Platform] = kwargs.get("platform")
+
+    @Lazy
+    def platform(self) -> Platform:
+        # Leaderboard Entries don't include this value, so it is taken
+        # from the leaderboard which the entry belongs to.
+        if "platform" in self._raw:
+            return Platform(self._raw["platform"])
+
+        return self._leaderboardPlatform
+
+    def toDict(self) -> dict:
+        # The platform is included so that the entry can be restored
+        # without the leaderboard which it belongs to.
+        return {**super().toDict(), "platform": self.platform.value}
+
+
+class LeaderboardColumns:
+    """
+    Columnar view of the entries of one or more Call of Duty leaderboard
+    pages. Each field is stored as a single array rather than as one object
+    per entry. The arrays are NumPy arrays when NumPy is installed, and
+    otherwise fall back to the standard library's array module.
+
+    Parameters
+    ----------
+    columns : list
+        Array of strings containing the column headers for the leaderboard.
+    rank : array
+        Leaderboard position of each entry.
+    username : array
+        Player's username of each entry.
+    updated : array
+        Value in seconds representing how long ago each entry was updated.
+    rating : array
+        Unknown rating value of each entry.
+    values : dict
+        Array of the values of each entry, keyed by column. Values which
+        are missing from an entry are NaN.
+    """
+
+    def __init__(
+        self,
+        columns: List[str],
+        rank: Sequence[int],
+        username: Sequence[str],
+        updated: Sequence[int],
+        rating: Sequence[float],
+        values: Dict[str, Sequence[float]],
+    ):
+        self.columns: List[str] = columns
+        self.rank: Sequence[int] = rank
+        self.username: Sequence[str] = username
+        self.updated: Sequence[int] = updated
+        self.rating: Sequence[float] = rating
+        self.values: Dict[str, Sequence[float]] = values
+
+    def __len__(self) -> int:
+        return len(self.rank)
+
+    def __getitem__(self, column: str) -> Sequence[Any]:
+        if column in ("rank", "username", "updated", "rating"):
+            return getattr(self, column)
+
+        return self.values[column]
+
+    @staticmethod
+    def fromLeaderboards(leaderboards: Iterable[Leaderboard]) -> "LeaderboardColumns":
+        """
+        Build a columnar view of the entries of many leaderboard pages, such
+        as every page of the same leaderboard.
+
+        Parameters
+        ----------
+        leaderboards : iterable
+            Leaderboard objects whose entries are combined, in order.
+
+        Returns
+        -------
+        object
+            LeaderboardColumns object containing every entry.
+        """
+
+        columns: List[str] = []
+        rank: List[int] = []
+        username: List[str] = []
+        updated: List[int] = []
+        rating: List[float] = []
+        values: Dict[str, List[float]] = {}
+
+        for leaderboard in leaderboards:
+            for column in leaderboard.columns:
+                if column not in values:
+                    columns.append(column)
+                    values[column] = [math.nan] * len(rank)
+
+            for entry in leaderboard._raw.get("entries", []):
+                rank.append(int(entry["rank"]))
+                username.append(entry["username"])
+                updated.append(int(entry["updateTime"]))
+                rating.append(entry["rating"])
+
+                _values: dict = entry["values"]
+                for column in columns:
+                    values[column].append(_values.get(column, math.nan))
+
+        return LeaderboardColumns(
+            columns,
+            _Array(rank, "q"),
+            _Array(username, None),
+            _Array(updated, "q"),
+            _Array(rating, "d"),
+            {column: _Array(values[column], "d") for column in columns},
+        )
+
+    def sort(self, column: str, **kwargs) -> "LeaderboardColumns":
+        """
+        Get the entries sorted by a column. Entries with equal values keep
+        their order, and entries which are missing the value are last.
+
+        Parameters
+        ----------
+        column : str
+            Column to sort by, including rank, username, updated, and rating.
+        descending : bool, optional
+            Boolean indicating whether to sort from highest to lowest (default is False.)
+
+        Returns
+        -------
+        object
+            LeaderboardColumns object containing the sorted entries.
+        """
+
+        descending: bool = kwargs.get("descending", False)
+        values: Sequence[Any] = self[column]
+
+        if (numpy is not None) and (values.dtype.kind in "if"):
+            order = numpy.argsort(-values if descending else values, kind="stable")
+        else:
+            # NaN is the only value which is not equal to itself.
+            present: List[int] = [
+                i for i in range(len(values)) if values[i] == values[i]
+            ]
+            missing: List[int] = [
+                i for i in range(len(values)) if values[i] != values[i]
+            ]
+            present.sort(key=values.__getitem__, reverse=descending)
+
+            order = present + missing
+
+        return self._take(order)
+
+    def filter(self, mask: Sequence[bool]) -> "LeaderboardColumns":
+        """
+        Get the entries for which a mask is true, such as the result of
+        comparing a column to a value.
+
+        Parameters
+        ----------
+        mask : array
+            Boolean value for each entry indicating whether to keep it.
+
+        Returns
+        -------
+        object
+            LeaderboardColumns object containing the matching entries.
+        """
+
+        if numpy is not None:
+            return self._take(numpy.flatnonzero(numpy.asarray(mask, dtype=bool)))
+
+        return self._take([i for i, keep in enumerate(mask) if keep])
+
+    def top(self, column: str, count: int) -> "LeaderboardColumns":
+        """
+        Get the entries with the highest values of a column, highest first.
+
+        Parameters
+        ----------
+        column : str
+            Column to rank the entries by.
+        count : int
+            Number of entries to get.
+
+        Returns
+        -------
+        object
+            LeaderboardColumns object containing at most count entries.
+        """
+
+        values: Sequence[float] = self[column]
+        count = max(count, 0)
+
+        if (numpy is not None) and (values.dtype.kind in "if"):
+            present = numpy.flatnonzero(values == values)
+
+            if 0 < count < len(present):
+                # Only the top entries are partitioned from the rest, so
+                # that the whole column does not need to be sorted.
+                present = present[
+                    numpy.argpartition(-values[present], count - 1)[:count]
+                ]
+
+            order = present[numpy.argsort(-values[present], kind="stable")][:count]
+        else:
+            # NaN is the only value which is not equal to itself.
+            present: List[int] = [
+                i for i in range(len(values)) if values[i] == values[i]
+            ]
+            order = heapq.nlargest(count, present, key=values.__getitem__)
+
+        return self._take(order)
+
+    def percentile(self, column: str, percentile: float) -> float:
+        """
+        Get a percentile of a column, interpolating linearly between
+        entries. Entries which are missing the value are ignored.
+
+        Parameters
+        ----------
+        column : str
+            Column to get the percentile of.
+        percentile : float
+            Percentile to get, between 0 and 100.
+
+        Returns
+        -------
+        float
+            Value of the percentile, or NaN if there are no values.
+        """
+
+        if (percentile < 0) or (percentile > 100):
+            raise ValueError("percentile must be between 0 and 100")
+
+        values: Sequence[float] = self[column]
+
+        if numpy is not None:
+            present = values[~numpy.isnan(values)]
+        else:
+            present: List[float] = sorted(value for value in values if value == value)
+
+        if len(present) == 0:
+            return math.nan
+        elif numpy is not None:
+            return float(numpy.percentile(present, percentile))
+
+        position: float = (len(present) - 1) * (percentile / 100)
+        lower: int = math.floor(position)
+        upper: int = math.ceil(position)
+
+        return present[lower] + (present[upper] - present[lower]) * (position - lower)
+
+    def _take(self, indices: Sequence[int]) -> "LeaderboardColumns":
+        def take(values: Sequence[Any]) -> Sequence[Any]:
+            if numpy is not None:
+                return values[numpy.asarray(indices, dtype=numpy.intp)]
+
+            taken: List[Any] = [values[i] for i in indices]
+
+            if isinstance(values, array.array):
+                return array.array(values.typecode, taken)
+
+            return taken
+
+        return LeaderboardColumns(
+            self.columns,
+            take(self.rank),
+            take(self.username),
+            take(self.updated),
+            take(self.rating),
+            {column: take(self.values[column]) for column in self.columns},
+        )
+
+
+def _Array(values: List[Any], typecode: Optional[str]) -> Sequence[Any]:
+    # Usernames have no typecode, and are kept as a list when NumPy is not
+    # installed.
+    if numpy is not None:
+        if typecode is None:
+            return numpy.array(values, dtype=object)
+        elif typecode == "q":
+            return numpy.array(values, dtype=numpy.int64)
+
+        return numpy.array(values, dtype=numpy.float64)
+
+    if typecode is None:
+        return values
 
-        self.platform: Platform = Platform(data.pop("platform"))
-        self.username: str = data.pop("username")
-        self.rank: int = int(data.pop("rank"))
-        self.updated: int = int(data.pop("updateTime"))
-        self.rating: int = data.pop("rating")
-        self.values: Dict[str, Union[int, float]] = data.pop("values")
+    return array.array(typecode, values)
@@ -1,7 +1,7 @@
 import logging
 from typing import List, Optional
 
-from .object import Object
+from .object import Field, Lazy, Object
 
 log: logging.Logger = logging.getLogger(__name__)
 
@@ -30,28 +30,56 @@ class Loadout(Object):
 
     _type: str = "Loadout"
 
-    def __init__(self, client, data: dict):
-        super().__init__(client)
+    __slots__ = (
+        "_name",
+        "_primary",
+        "_secondary",
+        "_equipment",
+        "_perks",
+        "_wildcards",
+        "_unlocked",
+    )
 
-        self.name: str = data.pop("customClassName")
-        self.primary: LoadoutWeapon = LoadoutWeapon(self, data.pop("primaryWeapon"))
-        self.secondary: LoadoutWeapon = LoadoutWeapon(self, data.pop("secondaryWeapon"))
-        self.equipment: List[LoadoutItem] = []
-        self.perks: List[LoadoutItem] = []
-        self.wildcards: List[LoadoutItem] = []
-        self.unlocked: bool = data.pop("unlocked")
+    name: str = Field("customClassName")
+    unlocked: bool = Field()
 
-        if (_equipment := data.pop("equipment")) is not None:
-            self.equipment.append(LoadoutItem(self, _equipment))
+    @Lazy
+    def primary(self) -> "LoadoutWeapon":
+        return LoadoutWeapon(self._client, self._raw["primaryWeapon"])
 
-        if (_gear := data.pop("gear")) is not None:
-            self.equipment.append(LoadoutItem(self, _gear))
+    @Lazy
+    def secondary(self) -> "LoadoutWeapon":
+        return LoadoutWeapon(self._client, self._raw["secondaryWeapon"])
 
-        for _perk in data.pop("perks"):
-            self.perks.append(LoadoutItem(self, _perk))
+    @Lazy
+    def equipment(self) -> List["LoadoutItem"]:
+        equipment: List[LoadoutItem] = []
 
-        for _wildcard in data.pop("wildcards"):
-            self.wildcards.append(LoadoutItem(self, _wildcard))
+        if (_equipment := self._raw["equipment"]) is not None:
+            equipment.append(LoadoutItem(self._client, _equipment))
+
+        if (_gear := self._raw["gear"]) is not None:
+            equipment.append(LoadoutItem(self._client, _gear))
+
+        return equipment
+
+    @Lazy
+    def perks(self) -> List["LoadoutItem"]:
+        perks: List[LoadoutItem] = []
+
+        for _perk in self._raw["perks"]:
+            perks.append(LoadoutItem(self._client, _perk))
+
+        return perks
+
+    @Lazy
+    def wildcards(self) -> List["LoadoutItem"]:
+        wildcards: List[LoadoutItem] = []
+
+        for _wildcard in self._raw["wildcards"]:
+            wildcards.append(LoadoutItem(self._client, _wildcard))
+
+        return wildcards
 
 
 class LoadoutWeapon(Object):
@@ -72,29 +100,36 @@ class LoadoutWeapon(Object):
 
     _type: str = "LoadoutWeapon"
 
-    def __init__(self, client, data: dict):
-        super().__init__(client)
+    __slots__ = ("_id", "_variant", "_attachments", "_camo")
+
+    id: str = Field()
+    camo: bool = Field("camoEquipped")
 
-        self.id: str = data.pop("id")
-        self.variant: Optional[str] = None
-        self.attachments: List[LoadoutItem] = []
-        self.camo: bool = data.pop("camoEquipped")
+    @Lazy
+    def variant(self) -> Optional[str]:
+        if (_variant := self._raw["variant"]) is None:
+            return None
 
-        if (_variant := data.pop("variant")) is not None:
-            self.variant: Optional[str] = _variant["id"]
+        return _variant["id"]
+
+    @Lazy
+    def attachments(self) -> List["LoadoutItem"]:
+        attachments: List[LoadoutItem] = []
 
         # Optics and Operator Mods are attachments, there's no reason to
         # seperate them from the attachments array.
         # This is also to (hopefully) make Modern Warfare support easier.
-        if (_optic := data.pop("optic")) is not None:
-            self.attachments.append(LoadoutItem(self, _optic))
+        if (_optic := self._raw["optic"]) is not None:
+            attachments.append(LoadoutItem(self._client, _optic))
 
-        if (_opMod := data.pop("operatorMod")) is not None:
-            self.attachments.append(LoadoutItem(self, _opMod))
+        if (_opMod := self._raw["operatorMod"]) is not None:
+            attachments.append(LoadoutItem(self._client, _opMod))
 
-        if (_attachments := data.pop("attachments")) is not None:
+        if (_attachments := self._raw["attachments"]) is not None:
             for _attachment in _attachments:
-                self.attachments.append(LoadoutItem(self, _attachment))
+                attachments.append(LoadoutItem(self._client, _attachment))
+
+        return attachments
 
 
 class LoadoutItem(Object):
@@ -109,7 +144,8 @@ class LoadoutItem(Object):
 
     _type: str = "LoadoutItem"
 
-    def __init__(self, client, data: dict):
-        super().__init__(client)
+    _compact: bool = True
+
+    __slots__ = ("_id",)
 
-        self.id: str = data.pop("id")
+    id: str = Field()
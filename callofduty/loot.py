@@ -1,8 +1,11 @@
+import hashlib
+import json
 import logging
-from typing import List, Optional
+import sys
+from typing import Dict, List, Optional
 
 from .enums import Language, Platform, Title
-from .object import Object
+from .object import Field, Lazy, Object
 
 log: logging.Logger = logging.getLogger(__name__)
 
@@ -31,22 +34,39 @@ class Season(Object):
 
     _type: str = "Season"
 
-    def __init__(self, client, data: dict):
-        super().__init__(client)
+    __slots__ = (
+        "_title",
+        "_season",
+        "_platform",
+        "_name",
+        "_tiers",
+        "_chase",
+        "_language",
+    )
+
+    title: Title = Field(convert=Title)
+    season: int = Field()
+    platform: Platform = Field(convert=Platform)
+    name: Optional[str] = Field("categoryTitle", default=None)
+    language: Language = Field(convert=Language)
+
+    @Lazy
+    def tiers(self) -> List["LootItem"]:
+        tiers: List[LootItem] = []
+
+        for tier in (_tiers := self._raw.get("tiers", [])) :
+            tiers.append(LootItem(self._client, _tiers[tier]))
+
+        return tiers
 
-        self.title: Title = Title(data.pop("title"))
-        self.season: int = data.pop("season")
-        self.platform: Platform = Platform(data.pop("platform"))
-        self.name: Optional[str] = data.pop("categoryTitle", None)
-        self.tiers: List[LootItem] = []
-        self.chase: List[LootItem] = []
-        self.language: Language = Language(data.pop("language"))
+    @Lazy
+    def chase(self) -> List["LootItem"]:
+        chase: List[LootItem] = []
 
-        for tier in (_tiers := data.pop("tiers", [])) :
-            self.tiers.append(LootItem(self, _tiers[tier]))
+        for item in (_chase := self._raw.get("chase", [])) :
+            chase.append(LootItem(self._client, _chase[item]))
 
-        for chase in (_chase := data.pop("chase", [])) :
-            self.chase.append(LootItem(self, _chase[chase]))
+        return chase
 
 
 class LootItem(Object):
@@ -73,13 +93,184 @@ class LootItem(Object):
 
     _type: str = "LootItem"
 
+    _compact: bool = True
+
+    __slots__ = ("_id", "_name", "_category", "_rarity", "_tier", "_image", "_free")
+
+    id: str = Field("name")
+    name: str = Field("label")
+    # Categories and rarities are shared by many items, so a single
+    # copy of each string is kept.
+    category: str = Field("type", sys.intern)
+    rarity: str = Field(convert=sys.intern)
+    tier: int = Field(convert=int)
+    image: str = Field()
+    free: bool = Field(default=False)
+
+
+class LootCatalogue(Object):
+    """
+    Represents every Call of Duty loot season of a title, indexed so that
+    loot items can be looked up without scanning each season.
+
+    Parameters
+    ----------
+    title : callofduty.Title
+        Call of Duty title which the loot seasons originate.
+    platform : callofduty.Platform
+        Platform which the loot seasons are available on.
+    language : callofduty.Language
+        Language which the loot data is in.
+    seasons : dict
+        Season objects keyed by loot season number.
+    items : list
+        Array of Loot Items containing the tier and chase loot of every season.
+    """
+
+    _type: str = "LootCatalogue"
+
+    __slots__ = (
+        "title",
+        "platform",
+        "language",
+        "seasons",
+        "items",
+        "_digests",
+        "_ids",
+        "_rarities",
+        "_categories",
+        "_tiers",
+    )
+
     def __init__(self, client, data: dict):
         super().__init__(client)
 
-        self.id: str = data.pop("name")
-        self.name: str = data.pop("label")
-        self.category: str = data.pop("type")
-        self.rarity: str = data.pop("rarity")
-        self.tier: int = int(data.pop("tier"))
-        self.image: str = data.pop("image")
-        self.free: bool = data.pop("free", False)
+        self.title: Title = Title(data["title"])
+        self.platform: Platform = Platform(data["platform"])
+        self.language: Language = Language(data["language"])
+        self.seasons: Dict[int, Season] = {}
+        self.items: List[LootItem] = []
+
+        self._digests: Dict[int, str] = {}
+        self._ids: Dict[str, LootItem] = {}
+        self._rarities: Dict[str, List[LootItem]] = {}
+        self._categories: Dict[str, List[LootItem]] = {}
+        self._tiers: Dict[int, List[LootItem]] = {}
+
+        previous: Optional[LootCatalogue] = data.get("previous")
+
+        # Season numbers are strings when the data was restored from JSON.
+        for season, _season in sorted(
+            (int(season), _season) for season, _season in data["seasons"].items()
+        ):
+            digest: str = hashlib.sha1(
+                json.dumps(_season, sort_keys=True).encode("utf-8")
+            ).hexdigest()
+
+            # Seasons whose content has not changed since the previous
+            # catalogue are reused rather than built again.
+            if (previous is not None) and (previous._digests.get(season) == digest):
+                self.seasons[season] = previous.seasons[season]
+            else:
+                self.seasons[season] = Season(client, _season)
+
+            self._digests[season] = digest
+
+        for season in self.seasons.values():
+            for item in season.tiers + season.chase:
+                self.items.append(item)
+
+                self._ids[item.id] = item
+                self._rarities.setdefault(item.rarity, []).append(item)
+                self._categories.setdefault(item.category, []).append(item)
+                self._tiers.setdefault(item.tier, []).append(item)
+
+    def toDict(self) -> dict:
+        """
+        Get the data of the catalogue in the form which it is built from.
+
+        Returns
+        -------
+        dict
+            JSON-compatible data of the catalogue.
+        """
+
+        seasons: Dict[int, dict] = {}
+        for season, _season in self.seasons.items():
+            seasons[season] = _season.toDict()
+
+        return {
+            "title": self.title.value,
+            "platform": self.platform.value,
+            "language": self.language.value,
+            "seasons": seasons,
+        }
+
+    def item(self, id: str) -> Optional[LootItem]:
+        """
+        Get a loot item by its internal name.
+
+        Parameters
+        ----------
+        id : str
+            Internal name of the loot item.
+
+        Returns
+        -------
+        object
+            LootItem object, or None if no season contains the item.
+            When several seasons contain the item, the latest season's is returned.
+        """
+
+        return self._ids.get(id)
+
+    def byRarity(self, rarity: str) -> List[LootItem]:
+        """
+        Get the loot items of a rarity, ordered by season.
+
+        Parameters
+        ----------
+        rarity : str
+            Rarity of the loot items.
+
+        Returns
+        -------
+        list
+            Array of LootItem objects.
+        """
+
+        return list(self._rarities.get(rarity, []))
+
+    def byCategory(self, category: str) -> List[LootItem]:
+        """
+        Get the loot items of a type, ordered by season.
+
+        Parameters
+        ----------
+        category : str
+            Type of the loot items.
+
+        Returns
+        -------
+        list
+            Array of LootItem objects.
+        """
+
+        return list(self._categories.get(category, []))
+
+    def byTier(self, tier: int) -> List[LootItem]:
+        """
+        Get the loot items rewarded at a tier in any season, ordered by season.
+
+        Parameters
+        ----------
+        tier : int
+            Tier which the loot items are rewarded.
+
+        Returns
+        -------
+        list
+            Array of LootItem objects.
+        """
+
+        return list(self._tiers.get(tier, []))
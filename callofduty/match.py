@@ -1,8 +1,9 @@
+import asyncio
 import logging
-from typing import List
+from typing import List, Optional
 
 from .enums import Platform, Title
-from .object import Object
+from .object import Field, Object
 from .player import Player
 
 log: logging.Logger = logging.getLogger(__name__)
@@ -20,16 +21,29 @@ class Match(Object):
         Platform of the player.
     title : callofduty.Title
         Title which the match took place.
+    timestamp : int, optional
+        Unix timestamp in milliseconds representing when the match started (default is None.)
+    data : dict, optional
+        JSON data of the match which was included in the player's match
+        history, such as the player's stats (default is None.)
     """
 
     _type: str = "Match"
 
+    __slots__ = ("_id", "_platform", "_title", "_timestamp", "_data", "_details")
+
+    id: int = Field()
+    platform: Platform = Field(convert=Platform)
+    title: Title = Field(convert=Title)
+    timestamp: Optional[int] = Field(default=None)
+    data: Optional[dict] = Field(default=None)
+
     def __init__(self, client, data: dict):
-        super().__init__(client)
+        super().__init__(client, data)
 
-        self.id: int = data.pop("id")
-        self.platform: Platform = Platform(data.pop("platform"))
-        self.title: Title = Title(data.pop("title"))
+        # The match details are requested on first use and then shared by
+        # every view of the match, such as its teams.
+        self._details: Optional[asyncio.Future] = None
 
     async def teams(self) -> List[List[Player]]:
         """
@@ -43,11 +57,12 @@ class Match(Object):
             players on the team.
         """
 
-        return await self._client.GetMatchTeams(self.title, self.platform, self.id)
+        return self._client._MatchTeams(await self.details())
 
     async def details(self) -> dict:
         """
-        Get the full details of the match.
+        Get the full details of the match. The details are only requested
+        once, no matter how many times this or teams() is called.
 
         Returns
         -------
@@ -55,4 +70,30 @@ class Match(Object):
             JSON data containing the full details of the match.
         """
 
-        return await self._client.GetMatchDetails(self.title, self.platform, self.id)
+        if self._details is None:
+            self._details = asyncio.ensure_future(
+                self._client.GetMatchDetails(self.title, self.platform, self.id)
+            )
+
+        future: asyncio.Future = self._details
+
+        try:
+            return await asyncio.shield(future)
+        except Exception:
+            # Failed requests are not kept so that they may be retried.
+            if self._details is future:
+                self._details = None
+
+            raise
+
+    def _setDetails(self, data: dict):
+        self._details = asyncio.get_running_loop().create_future()
+        self._details.set_result(data)
+
+    def _hasDetails(self) -> bool:
+        return (
+            (self._details is not None)
+            and self._details.done()
+            and (self._details.cancelled() is False)
+            and (self._details.exception() is None)
+        )
@@ -1,5 +1,8 @@
 import logging
-from typing import Optional
+from enum import Enum
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from . import enums
 
 log: logging.Logger = logging.getLogger(__name__)
 
@@ -12,13 +15,32 @@ class Object:
     ----------
     client : callofduty.Client
         Client which manages communication with the Call of Duty API.
+    data : dict, optional
+        JSON data which the object's Fields are read from (default is None.)
     """
 
     _type: Optional[str] = None
 
-    def __init__(self, client):
+    # Compact objects read all of their Fields when the first one is
+    # accessed, then release the raw data so that only the values are
+    # retained. Used for small objects which are built in large numbers,
+    # and whose Fields depend on nothing but the raw data.
+    _compact: bool = False
+
+    __slots__ = ("_client", "_raw")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        _models[cls.__name__] = cls
+
+    def __init__(self, client, data: Optional[dict] = None):
         self._client = client
 
+        # The raw data is never modified, as it may be shared with the
+        # caller or with other objects.
+        self._raw: Optional[dict] = data
+
     @property
     def type(self) -> Optional[str]:
         return self._type
@@ -28,3 +50,307 @@ class Object:
 
     def __str__(self) -> str:
         return self.__repr__()
+
+    def toDict(self) -> dict:
+        """
+        Get the data of the object in the form which it is built from.
+        Values which were assigned to the object's Fields since it was
+        built are included, and nested objects are encoded so that they
+        can be restored by fromDict.
+
+        Returns
+        -------
+        dict
+            JSON-compatible data of the object.
+        """
+
+        return Encode(self._currentData())
+
+    @classmethod
+    def fromDict(cls, client, data: dict):
+        """
+        Build an object from data returned by toDict. The data is not
+        validated, and the object's Fields are read from it lazily.
+
+        Parameters
+        ----------
+        client : callofduty.Client
+            Client which manages communication with the Call of Duty API.
+        data : dict
+            Data of the object, as returned by toDict.
+
+        Returns
+        -------
+        object
+            Object of the class which this method is called on.
+        """
+
+        return cls(client, Decode(client, data))
+
+    def _currentData(self) -> dict:
+        data: dict = dict(self._raw or {})
+
+        for field in _Fields(type(self)):
+            # Lazy values are built by methods rather than read from the
+            # raw data, so they are rebuilt when restored.
+            if isinstance(field, Lazy):
+                continue
+
+            if (value := getattr(self, field.slot, _Missing)) is not _Missing:
+                data[field.key] = value
+
+        return data
+
+    def _Compact(self):
+        # None of the Fields are cached yet, as compaction happens on the
+        # first access or assignment of any of them.
+        for field in _Fields(type(self)):
+            setattr(self, field.slot, field.Load(self))
+
+        self._raw = None
+
+
+# Sentinel for Fields which have no default value, or are not yet cached.
+_Missing: object = object()
+
+# Keys which mark the encoded data of a nested object, and of values
+# which are encoded exactly.
+_Model: str = "__model__"
+_Enum: str = "__enum__"
+_Tuple: str = "__tuple__"
+_Dict: str = "__dict__"
+
+# Key of the raw data under which values assigned to Lazy attributes are
+# kept, so that they are included by toDict and restored by fromDict.
+_Assigned: str = "__assigned__"
+
+# Object classes keyed by name, used to restore encoded objects.
+_models: Dict[str, type] = {}
+
+# Fields of each Object class, including Lazy values.
+_fields: Dict[type, Tuple["Field", ...]] = {}
+
+
+def _Fields(cls: type) -> Tuple["Field", ...]:
+    if (fields := _fields.get(cls)) is None:
+        found: Dict[str, Field] = {}
+
+        for parent in reversed(cls.__mro__):
+            for name, value in vars(parent).items():
+                if isinstance(value, Field):
+                    found[name] = value
+
+        fields = _fields[cls] = tuple(found.values())
+
+    return fields
+
+
+def Encode(value: Any, **kwargs) -> Any:
+    """
+    Convert a value, which may contain Call of Duty objects and enums,
+    into JSON-compatible data.
+
+    Parameters
+    ----------
+    value : object
+        Value to encode.
+    exact : bool, optional
+        Boolean indicating whether enums, tuples, and dicts with keys which
+        are not strings are encoded so that Decode restores them exactly,
+        rather than as plain values (default is False.)
+
+    Returns
+    -------
+    object
+        JSON-compatible data, in which objects are replaced by their
+        toDict data and enums by their values.
+    """
+
+    exact: bool = kwargs.get("exact", False)
+
+    if isinstance(value, dict):
+        if (exact is True) and not all(isinstance(key, str) for key in value):
+            return {
+                _Dict: [
+                    [Encode(k, **kwargs), Encode(v, **kwargs)] for k, v in value.items()
+                ]
+            }
+
+        return {key: Encode(_value, **kwargs) for key, _value in value.items()}
+    elif isinstance(value, list):
+        return [Encode(_value, **kwargs) for _value in value]
+    elif isinstance(value, tuple):
+        if exact is True:
+            return {_Tuple: [Encode(_value, **kwargs) for _value in value]}
+
+        return [Encode(_value, **kwargs) for _value in value]
+    elif isinstance(value, Object):
+        return {
+            _Model: value.__class__.__name__,
+            "data": Encode(value.toDict(), **kwargs),
+        }
+    elif isinstance(value, Enum):
+        if exact is True:
+            return {_Enum: value.__class__.__name__, "value": value.value}
+
+        return value.value
+    elif (exact is True) and not isinstance(value, (str, int, float, bool, type(None))):
+        raise TypeError(f"Object of type {type(value).__name__} cannot be serialized")
+
+    return value
+
+
+def Decode(client, value: Any) -> Any:
+    """
+    Restore the Call of Duty objects in data returned by Encode.
+
+    Parameters
+    ----------
+    client : callofduty.Client
+        Client which manages communication with the Call of Duty API.
+    value : object
+        Data to decode.
+
+    Returns
+    -------
+    object
+        Data in which encoded objects, enums, tuples, and dicts are
+        replaced by the values which they represent.
+    """
+
+    if isinstance(value, dict):
+        if (model := value.get(_Model)) is not None:
+            return _models[model].fromDict(client, value["data"])
+        elif (enum := value.get(_Enum)) is not None:
+            return getattr(enums, enum)(value["value"])
+        elif (items := value.get(_Tuple)) is not None:
+            return tuple(Decode(client, _value) for _value in items)
+        elif (items := value.get(_Dict)) is not None:
+            return {Decode(client, k): Decode(client, v) for k, v in items}
+
+        return {key: Decode(client, _value) for key, _value in value.items()}
+    elif isinstance(value, list):
+        return [Decode(client, _value) for _value in value]
+
+    return value
+
+
+class Field:
+    """
+    Attribute of a Call of Duty object which is read from the object's raw
+    data when it is first accessed. The value is then cached in the slot
+    of the same name prefixed with an underscore, so classes which use a
+    Field must declare that slot.
+
+    Parameters
+    ----------
+    key : str, optional
+        Key of the value in the raw data (default is the attribute name.)
+    convert : callable, optional
+        Function which is called with the raw value (default is None.)
+    default : object, optional
+        Value to use when the key is not present in the raw data. If no
+        default is set, a missing key raises a KeyError.
+    """
+
+    __slots__ = ("key", "convert", "default", "slot")
+
+    def __init__(
+        self,
+        key: Optional[str] = None,
+        convert: Optional[Callable[[Any], Any]] = None,
+        default: Any = _Missing,
+    ):
+        self.key: Optional[str] = key
+        self.convert: Optional[Callable[[Any], Any]] = convert
+        self.default: Any = default
+        self.slot: Optional[str] = None
+
+    def __set_name__(self, owner, name: str):
+        if self.key is None:
+            self.key = name
+
+        self.slot = f"_{name}"
+
+    def __get__(self, instance, owner=None) -> Any:
+        if instance is None:
+            return self
+
+        if (value := getattr(instance, self.slot, _Missing)) is _Missing:
+            if instance._compact is True:
+                instance._Compact()
+
+                return getattr(instance, self.slot)
+
+            value = self.Load(instance)
+            setattr(instance, self.slot, value)
+
+        return value
+
+    def __set__(self, instance, value: Any):
+        if (instance._compact is True) and (instance._raw is not None):
+            instance._Compact()
+
+        setattr(instance, self.slot, value)
+
+    def Load(self, instance) -> Any:
+        """
+        Build the value of the attribute from the object's raw data.
+
+        Parameters
+        ----------
+        instance : callofduty.Object
+            Object which the attribute belongs to.
+
+        Returns
+        -------
+        object
+            Value of the attribute.
+        """
+
+        if self.key not in instance._raw:
+            if self.default is _Missing:
+                raise KeyError(self.key)
+
+            return self.default
+
+        value: Any = instance._raw[self.key]
+
+        if self.convert is not None:
+            return self.convert(value)
+
+        return value
+
+
+class Lazy(Field):
+    """
+    Attribute of a Call of Duty object which is built by a method when it
+    is first accessed, such as nested objects. Used as a decorator.
+
+    Parameters
+    ----------
+    func : callable
+        Method which builds the value of the attribute.
+    """
+
+    __slots__ = ("func",)
+
+    def __init__(self, func: Callable[[Any], Any]):
+        super().__init__()
+
+        self.func: Callable[[Any], Any] = func
+
+    def __set__(self, instance, value: Any):
+        super().__set__(instance, value)
+
+        # The raw data is replaced by a copy, as it may be shared.
+        if instance._raw is not None:
+            assigned: dict = {**instance._raw.get(_Assigned, {}), self.key: value}
+            instance._raw = {**instance._raw, _Assigned: assigned}
+
+    def Load(self, instance) -> Any:
+        if (instance._raw is not None) and (_Assigned in instance._raw):
+            if self.key in (assigned := instance._raw[_Assigned]):
+                return assigned[self.key]
+
+        return self.func(instance)
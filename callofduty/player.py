@@ -1,10 +1,10 @@
 import logging
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
 from .enums import Mode, Platform, Title
 from .errors import InvalidPlatform
 from .loadout import Loadout, LoadoutItem
-from .object import Object
+from .object import Decode, Encode, Field, Lazy, Object, _Assigned
 
 log: logging.Logger = logging.getLogger(__name__)
 
@@ -17,8 +17,8 @@ class Player(Object):
     ----------
     platform : callofduty.Platform
         Platform of the player.
-    username : str
-        Player's username for the designated platform.
+    username : str, optional
+        Player's username for the designated platform (default is None.)
     accountId : int, optional
         Account ID for the player's designated platform (default is None.)
     avatarUrl : str, optional
@@ -31,15 +31,57 @@ class Player(Object):
 
     _type: str = "Player"
 
-    def __init__(self, client, data: dict):
-        super().__init__(client)
-
-        self.platform: Platform = Platform(data.pop("platform"))
-        self.username: str = data.pop("username")
-        self.accountId: Optional[int] = data.pop("accountId", None)
-        self.avatarUrl: Optional[str] = data.pop("avatarUrl", None)
-        self.online: bool = data.pop("online", False)
-        self.identities: List[Player] = data.pop("identities", [])
+    __slots__ = (
+        "_platform",
+        "_username",
+        "_accountId",
+        "_avatarUrl",
+        "_online",
+        "_identities",
+        "__weakref__",
+    )
+
+    platform: Platform = Field(convert=Platform)
+    # Players which are only known by their account ID, such as some
+    # identities, have no username.
+    username: Optional[str] = Field(default=None)
+    accountId: Optional[int] = Field(default=None)
+    avatarUrl: Optional[str] = Field(default=None)
+    online: bool = Field(default=False)
+
+    @Lazy
+    def identities(self) -> List["Player"]:
+        return self._raw.get("identities", [])
+
+    def toDict(self) -> dict:
+        data: dict = self._currentData()
+        data.pop(_Assigned, None)
+
+        # Identities are stored without their own identities, as a player
+        # may be among the identities of its identities.
+        data["identities"] = []
+        for identity in self.identities:
+            _identity: dict = identity._currentData()
+            _identity.pop("identities", None)
+            _identity.pop(_Assigned, None)
+
+            data["identities"].append(_identity)
+
+        return Encode(data)
+
+    @classmethod
+    def fromDict(cls, client, data: dict) -> "Player":
+        data = Decode(client, data)
+
+        # Restored players are shared through the client's player map, in
+        # the same way as players built from a response. The data may be
+        # older than what is already known, so it only fills in values of
+        # an existing Player object which are unknown.
+        identities: List[Player] = []
+        for identity in data.get("identities", []):
+            identities.append(client.players.Get(identity, overwrite=False))
+
+        return client.players.Get({**data, "identities": identities}, overwrite=False)
 
     async def profile(self, title: Title, mode: Mode) -> dict:
         """
@@ -81,17 +123,53 @@ class Player(Object):
         endTimestamp : int, optional
             Unix timestamp representing the latest time which a returned
             match should've occured (default is None.)
+        summary : bool, optional
+            Boolean indicating whether to also return the matches summary
+            from the same request (default is False.)
 
         Returns
         -------
         list
-            Array of Match objects.
+            Array of Match objects. If summary is True, a tuple containing
+            the array of Match objects and the JSON data of the matches
+            summary is returned instead.
         """
 
         return await self._client.GetPlayerMatches(
             self.platform, self.username, title, mode, **kwargs
         )
 
+    async def matchHistory(self, title: Title, mode: Mode, **kwargs) -> AsyncIterator:
+        """
+        Get the Call of Duty player's entire match history for the specified
+        title and mode, newest first.
+
+        Parameters
+        ----------
+        title : callofduty.Title
+            Call of Duty title to get the player's matches from.
+        mode: callofduty.Mode
+            Call of Duty mode to get the player's matches from.
+        limit : int, optional
+            Number of matches which are requested per page (default is 20.)
+        startTimestamp : int, optional
+            Unix timestamp in milliseconds representing the earliest time
+            which a returned match should've occured (default is None.)
+        endTimestamp : int, optional
+            Unix timestamp in milliseconds representing the latest time
+            which a returned match should've occured (default is None.)
+
+        Returns
+        -------
+        AsyncIterator
+            Match objects, each returned only once.
+        """
+
+        async for match in self._client.GetPlayerMatchHistory(
+            self.platform, self.username, title, mode, **kwargs
+        ):
+            yield match
+
     async def matchesSummary(self, title: Title, mode: Mode, **kwargs) -> dict:
         """
         Get the Call of Duty player's match history for the specified title and mode.
@@ -156,6 +234,8 @@ class Player(Object):
             Call of Duty title to get the player's loadouts from.
         mode: callofduty.Mode, optional
             Call of Duty mode to get the player's loadouts from (default is Multiplayer.)
+        refresh : bool, optional
+            Boolean indicating whether to ignore a previously fetched response (default is False.)
 
         Returns
         -------
@@ -177,6 +257,8 @@ class Player(Object):
             Call of Duty title to get the player's loadout unlocks from.
         mode: callofduty.Mode, optional
             Call of Duty mode to get the player's loadout unlocks from (default is Multiplayer.)
+        refresh : bool, optional
+            Boolean indicating whether to ignore a previously fetched response (default is False.)
 
         Returns
         -------
@@ -188,6 +270,31 @@ class Player(Object):
             self.platform, self.username, title, **kwargs
         )
 
+    async def loadoutsAndUnlocks(self, title: Title, **kwargs) -> dict:
+        """
+        Get the Call of Duty player's loadouts and loadout unlocks for the
+        specified title and mode using a single request.
+
+        Parameters
+        ----------
+        title : callofduty.Title
+            Call of Duty title to get the player's loadouts from.
+        mode: callofduty.Mode, optional
+            Call of Duty mode to get the player's loadouts from (default is Multiplayer.)
+        refresh : bool, optional
+            Boolean indicating whether to ignore a previously fetched response (default is False.)
+
+        Returns
+        -------
+        dict
+            Array of loadout objects and array of loadout item objects,
+            keyed by loadouts and unlocks.
+        """
+
+        return await self._client.GetPlayerLoadoutsAndUnlocks(
+            self.platform, self.username, title, **kwargs
+        )
+
     async def authenticityStamp(self, phrase: str, **kwargs):
         """
         Get the Call of Duty player's Authenticity Stamp for the specified phrase.
@@ -222,7 +329,7 @@ class Player(Object):
         if self.platform is not Platform.Activision:
             raise InvalidPlatform()
 
-        return await self._client.AddFriend(self.accountId)
+        return await self._client.AddFriend(await self._resolveAccountId())
 
     async def removeFriend(self) -> str:
         """
@@ -237,7 +344,7 @@ class Player(Object):
         if self.platform is not Platform.Activision:
             raise InvalidPlatform()
 
-        return await self._client.RemoveFriend(self.accountId)
+        return await self._client.RemoveFriend(await self._resolveAccountId())
 
     async def addFavorite(self) -> list:
         """
@@ -275,7 +382,7 @@ class Player(Object):
         if self.platform is not Platform.Activision:
             raise InvalidPlatform()
 
-        await self._client.BlockPlayer(self.accountId)
+        await self._client.BlockPlayer(await self._resolveAccountId())
 
     async def unblock(self) -> None:
         """
@@ -289,7 +396,7 @@ class Player(Object):
         if self.platform is not Platform.Activision:
             raise InvalidPlatform()
 
-        await self._client.UnblockPlayer(self.accountId)
+        await self._client.UnblockPlayer(await self._resolveAccountId())
 
     async def squad(self):
         """
@@ -302,3 +409,13 @@ class Player(Object):
         """
 
         return await self._client.GetPlayerSquad(self.platform, self.username)
+
+    async def _resolveAccountId(self) -> Optional[int]:
+        # Friend actions require an account ID, which is looked up using
+        # the Client's identity index when it is not already known.
+        if self.accountId is None:
+            self.accountId = (
+                await self._client.ResolvePlayer(self.platform, self.username)
+            ).accountId
+
+        return self.accountId
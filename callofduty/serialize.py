@@ -0,0 +1,80 @@
+import json
+import logging
+from typing import Any
+
+from .object import Decode, Encode
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+log: logging.Logger = logging.getLogger(__name__)
+
+# The first byte of serialized data identifies the format which it is
+# in, so that data from either format can be deserialized.
+_MessagePack: bytes = b"M"
+_JSON: bytes = b"J"
+
+
+def Serialize(value: Any) -> bytes:
+    """
+    Serialize Call of Duty objects, or raw JSON data returned by the
+    Call of Duty API, into a compact binary form. MessagePack is used
+    when the msgpack package is installed, otherwise compact JSON.
+    Values of any other type, such as exceptions, raise a TypeError.
+
+    Parameters
+    ----------
+    value : object
+        Object, raw JSON data, or an array, tuple, or dict which contains
+        them. Enums and dict keys which are not strings are preserved.
+
+    Returns
+    -------
+    bytes
+        Serialized data, which is restored by Deserialize.
+    """
+
+    # Enums, tuples, and dicts with keys which are not strings are encoded
+    # so that they are restored exactly, whichever format is used.
+    data: Any = Encode(value, exact=True)
+
+    if msgpack is not None:
+        return _MessagePack + msgpack.packb(data, use_bin_type=True)
+
+    return _JSON + json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def Deserialize(client, data: bytes) -> Any:
+    """
+    Restore Call of Duty objects, or raw JSON data, from data returned by
+    Serialize. The objects are not validated, and their values are read
+    from the data lazily.
+
+    Parameters
+    ----------
+    client : callofduty.Client
+        Client which the restored objects communicate with the Call of Duty API through.
+    data : bytes
+        Data returned by Serialize.
+
+    Returns
+    -------
+    object
+        Restored objects, or raw JSON data.
+    """
+
+    kind: bytes = data[:1]
+
+    if kind == _MessagePack:
+        if msgpack is None:
+            raise ImportError("The msgpack package is required to deserialize data")
+
+        value: Any = msgpack.unpackb(data[1:], raw=False, strict_map_key=False)
+    elif kind == _JSON:
+        value = json.loads(data[1:])
+    else:
+        raise ValueError(f"Unknown serialization format {kind!r}")
+
+    return Decode(client, value)
@@ -1,10 +1,11 @@
 import logging
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple, Union
 
-from .enums import Title
-from .object import Object
+from .enums import Mode, Platform, Title
+from .object import Field, Lazy, Object
 from .player import Player
+from .utils import AsCompleted, VerifyMode, VerifyTitle
 
 log: logging.Logger = logging.getLogger(__name__)
 
@@ -39,44 +40,118 @@ class Squad(Object):
 
     _type: str = "Squad"
 
-    def __init__(self, client, data: dict):
-        super().__init__(client)
+    __slots__ = (
+        "_id",
+        "_name",
+        "_description",
+        "_avatarUrl",
+        "_created",
+        "_new",
+        "_private",
+        "_points",
+        "_owner",
+        "_members",
+    )
+
+    id: str = Field("hash")
+    name: str = Field()
+    description: Optional[str] = Field(default=None)
+    avatarUrl: Optional[str] = Field(default=None)
+    created: Optional[str] = Field(default=None)
+    new: bool = Field("newlyFormed", default=False)
+    private: bool = Field(default=False)
+    points: Optional[int] = Field(default=None)
 
-        self.id: str = data.pop("hash")
-        self.name: str = data.pop("name")
-        self.description: Optional[str] = data.pop("description", None)
-        self.avatarUrl: Optional[str] = data.pop("avatarUrl", None)
-        self.created: Optional[str] = data.pop("created", None)
-        self.new: bool = data.pop("newlyFormed", False)
-        self.private: bool = data.pop("private", False)
-        self.points: Optional[int] = data.pop("points", None)
+    def __init__(self, client, data: dict):
+        super().__init__(client, data)
+
+        for member in [data["creator"], *data["members"]]:
+            client.identities.Add(
+                Platform(member["platform"]),
+                member["gamerTag"],
+                member["platformId"],
+                member["avatarUrl"],
+            )
 
+    @Lazy
+    def owner(self) -> Player:
         # The Squads endpoints do not follow the same structure as the rest,
         # so the following is a hacky solution to that problem...
-        self.owner: Player = Player(
-            client,
-            {
-                "platform": data["creator"]["platform"],
-                "username": data["creator"]["gamerTag"],
-                "accountId": data["creator"]["platformId"],
-                "avatarUrl": data["creator"]["avatarUrl"],
-            },
-        )
-
-        self.members: List[Player] = []
-        for member in data["members"]:
-            self.members.append(
-                Player(
-                    client,
-                    {
-                        "platform": member["platform"],
-                        "username": member["gamerTag"],
-                        "accountId": member["platformId"],
-                        "avatarUrl": member["avatarUrl"],
-                    },
+        return self._buildMember(self._raw["creator"])
+
+    @Lazy
+    def members(self) -> List[Player]:
+        members: List[Player] = []
+
+        for member in self._raw["members"]:
+            members.append(self._buildMember(member))
+
+        return members
+
+    async def hydrate(
+        self, title: Title, mode: Mode, **kwargs
+    ) -> Dict[Player, Dict[str, Union[dict, list, Exception]]]:
+        """
+        Get the profiles, and optionally loadouts, of every Squad member
+        concurrently. A request which fails does not prevent the others
+        from completing.
+
+        Parameters
+        ----------
+        title : callofduty.Title
+            Call of Duty title to get the members' profiles from.
+        mode: callofduty.Mode
+            Call of Duty mode to get the members' profiles from.
+        loadouts : bool, optional
+            Boolean indicating whether to also get the members' loadouts (default is False.)
+        concurrency : int, optional
+            Maximum number of requests, across all members, which are
+            performed at once (default is 10.)
+
+        Returns
+        -------
+        dict
+            JSON data of each member's profile, and array of loadout
+            objects if requested, keyed by Player object. A request which
+            failed maps to the exception which occured instead.
+        """
+
+        loadouts: bool = kwargs.get("loadouts", False)
+        concurrency: int = kwargs.get("concurrency", 10)
+
+        VerifyTitle(title)
+        VerifyMode(mode, title)
+
+        # The owner is usually also present in the members array.
+        players: Dict[Tuple[str, str], Player] = {}
+        for player in [self.owner, *self.members]:
+            players.setdefault((player.platform.value, player.username), player)
+
+        jobs: List[Tuple[Player, str]] = []
+        for player in players.values():
+            jobs.append((player, "profile"))
+
+            if loadouts is True:
+                jobs.append((player, "loadouts"))
+
+        async def fetch(job: Tuple[Player, str]) -> Union[dict, list]:
+            player, kind = job
+
+            if kind == "profile":
+                return await self._client.GetPlayerProfile(
+                    player.platform, player.username, title, mode
                 )
+
+            return await self._client.GetPlayerLoadouts(
+                player.platform, player.username, title, mode=mode
             )
 
+        results: Dict[Player, Dict[str, Union[dict, list, Exception]]] = {}
+        async for (player, kind), result in AsCompleted(fetch, jobs, concurrency):
+            results.setdefault(player, {})[kind] = result
+
+        return results
+
     async def join(self):
         """Join the Call of Duty Squad."""
 
@@ -87,6 +162,16 @@ class Squad(Object):
 
         await self._client.ReportSquad(self.id)
 
+    def _buildMember(self, member: dict) -> Player:
+        return self._client.players.Get(
+            {
+                "platform": member["platform"],
+                "username": member["gamerTag"],
+                "accountId": member["platformId"],
+                "avatarUrl": member["avatarUrl"],
+            },
+        )
+
 
 class SquadsTournament(Object):
     """
@@ -98,21 +183,33 @@ class SquadsTournament(Object):
 
     _type: str = "SquadsTournament"
 
-    def __init__(self, client, data: dict):
-        super().__init__(client)
-
-        self.id: int = data.pop("id")
-        self.name: Optional[str] = data.pop("name")
-        self.description: Optional[str] = data.pop("description")
-        self.category: str = data.pop("category")
-        self.title: Title = Title(data.pop("title"))
-        self.start: datetime = data.pop("start")
-        self.end: datetime = data.pop("end")
-        self.phase: str = data.pop("phase")
-        self.mode: str = data.pop("mode")
-        self.map: str = data.pop("map")
-        self.progressCoefficient: float = data.pop("progressCoefficient")
-        self.progressMin: float = data.pop("progressMin")
+    __slots__ = (
+        "_id",
+        "_name",
+        "_description",
+        "_category",
+        "_title",
+        "_start",
+        "_end",
+        "_phase",
+        "_mode",
+        "_map",
+        "_progressCoefficient",
+        "_progressMin",
+    )
+
+    id: int = Field()
+    name: Optional[str] = Field()
+    description: Optional[str] = Field()
+    category: str = Field()
+    title: Title = Field(convert=Title)
+    start: datetime = Field()
+    end: datetime = Field()
+    phase: str = Field()
+    mode: str = Field()
+    map: str = Field()
+    progressCoefficient: float = Field()
+    progressMin: float = Field()
 
 
 class SquadsReward(Object):
@@ -125,5 +222,7 @@ class SquadsReward(Object):
 
     _type: str = "SquadsChallenge"
 
+    __slots__ = ()
+
     def __init__(self, client, data: dict):
-        super().__init__(client)
+        super().__init__(client, data)
@@ -2,7 +2,7 @@ import logging
 from typing import Dict, List, Union
 
 from .enums import Mode, Platform, Title
-from .object import Object
+from .object import Field, Lazy, Object
 from .player import Player
 
 log: logging.Logger = logging.getLogger(__name__)
@@ -36,31 +36,64 @@ class AuthenticityStamp(Object):
 
     _type: str = "AuthenticityStamp"
 
-    def __init__(self, client, data: dict):
-        super().__init__(client)
-
-        self.platform: Platform = Platform(data.pop("platform"))
-        self.username: str = data.pop("username")
-        self.title: Title = Title(data.pop("title"))
-        self.mode: Mode = Mode(data.pop("mode"))
-        self.players: List[Player] = []
-        self.playersLeft: List[Player] = []
-        self.data: Dict[str, Union[int, str, bool, None]] = {}
-        self.settings: Dict[str, Union[float, bool]] = data.pop("gameSettings")
-        self.stats: Dict[str, Union[float]] = data.pop("playerStats")
-
-        for _player in data.pop("partyMembers"):
-            self.players.append(
-                Player(self, {"platform": self.platform, "username": _player})
+    __slots__ = (
+        "_platform",
+        "_username",
+        "_title",
+        "_mode",
+        "_players",
+        "_playersLeft",
+        "_data",
+        "_settings",
+        "_stats",
+    )
+
+    platform: Platform = Field(convert=Platform)
+    username: str = Field()
+    title: Title = Field(convert=Title)
+    mode: Mode = Field(convert=Mode)
+    settings: Dict[str, Union[float, bool]] = Field("gameSettings")
+    stats: Dict[str, Union[float]] = Field("playerStats")
+
+    @Lazy
+    def players(self) -> List[Player]:
+        players: List[Player] = []
+
+        for _player in self._raw["partyMembers"]:
+            players.append(
+                self._client.players.Get(
+                    {"platform": self.platform, "username": _player}
+                )
             )
 
-        for _player in data.pop("partyMembersLeft"):
-            self.players.append(
-                Player(self, {"platform": self.platform, "username": _player})
+        return players
+
+    @Lazy
+    def playersLeft(self) -> List[Player]:
+        players: List[Player] = []
+
+        for _player in self._raw["partyMembersLeft"]:
+            players.append(
+                self._client.players.Get(
+                    {"platform": self.platform, "username": _player}
+                )
             )
 
-        for key in data:
-            if (isinstance(data[key], dict) is False) and (
-                isinstance(data[key], list) is False
+        return players
+
+    @Lazy
+    def data(self) -> Dict[str, Union[int, str, bool, None]]:
+        data: Dict[str, Union[int, str, bool, None]] = {}
+
+        for key in self._raw:
+            # These values were added to the response by the client, so
+            # they are not part of the Authenticity Stamp's data.
+            if key in ("platform", "username", "title", "mode"):
+                continue
+
+            if (isinstance(self._raw[key], dict) is False) and (
+                isinstance(self._raw[key], list) is False
             ):
-                self.data[key] = data[key]
+                data[key] = self._raw[key]
+
+        return data
@@ -0,0 +1,226 @@
+import asyncio
+import json
+import logging
+import os
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+
+from .enums import Mode, Platform, Title
+from .match import Match
+from .utils import VerifyMode, VerifyPlatform, VerifyTitle
+
+log: logging.Logger = logging.getLogger(__name__)
+
+
+class MatchStore(ABC):
+    """
+    Base class for storage of the high-water marks used by MatchSync.
+    Subclass this and implement Load and Save to persist marks elsewhere.
+    """
+
+    @abstractmethod
+    async def Load(self, key: str) -> Optional[dict]:
+        """
+        Load the high-water mark for the specified key.
+
+        Parameters
+        ----------
+        key : str
+            Key which identifies the player, title, and mode.
+
+        Returns
+        -------
+        dict
+            JSON data of the high-water mark, or None if there is none.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def Save(self, key: str, mark: dict):
+        """
+        Save the high-water mark for the specified key.
+
+        Parameters
+        ----------
+        key : str
+            Key which identifies the player, title, and mode.
+        mark : dict
+            JSON data of the high-water mark.
+        """
+
+        raise NotImplementedError
+
+
+class MemoryMatchStore(MatchStore):
+    """Stores high-water marks in memory for the lifetime of the process."""
+
+    def __init__(self):
+        self.marks: Dict[str, dict] = {}
+
+    async def Load(self, key: str) -> Optional[dict]:
+        return self.marks.get(key)
+
+    async def Save(self, key: str, mark: dict):
+        self.marks[key] = mark
+
+
+class FileMatchStore(MatchStore):
+    """
+    Stores high-water marks in a JSON file.
+
+    Parameters
+    ----------
+    path : str
+        Path of the JSON file, which is created if it does not exist.
+    """
+
+    def __init__(self, path: str):
+        self.path: str = path
+        self.marks: Optional[Dict[str, dict]] = None
+
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    async def Load(self, key: str) -> Optional[dict]:
+        async with self._lock:
+            if self.marks is None:
+                self.marks = await asyncio.to_thread(self._Read)
+
+            return self.marks.get(key)
+
+    async def Save(self, key: str, mark: dict):
+        # The marks are read, updated, and written while holding the lock
+        # so that concurrent saves never write an outdated file.
+        async with self._lock:
+            if self.marks is None:
+                self.marks = await asyncio.to_thread(self._Read)
+
+            self.marks[key] = mark
+
+            await asyncio.to_thread(self._Write)
+
+    def _Read(self) -> Dict[str, dict]:
+        if os.path.exists(self.path) is False:
+            return {}
+
+        with open(self.path, "r", encoding="utf-8") as file:
+            return json.load(file)
+
+    def _Write(self):
+        # Write to a temporary file first so that an interrupted write
+        # never leaves a corrupt checkpoint behind.
+        temporary: str = f"{self.path}.tmp"
+
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump(self.marks, file)
+
+        os.replace(temporary, self.path)
+
+
+class MatchSync:
+    """
+    Incrementally syncs Call of Duty players' match histories. The newest
+    match seen for each player, title, and mode is recorded in a store, and
+    only matches played after it are requested on the next sync.
+
+    Parameters
+    ----------
+    client : callofduty.Client
+        Client which manages communication with the Call of Duty API.
+    store : callofduty.MatchStore, optional
+        Store which high-water marks are checkpointed to (default is a MemoryMatchStore.)
+    """
+
+    def __init__(self, client, store: Optional[MatchStore] = None):
+        self.client = client
+        self.store: MatchStore = store if store is not None else MemoryMatchStore()
+
+    @staticmethod
+    def Key(platform: Platform, username: str, title: Title, mode: Mode) -> str:
+        """
+        Get the store key for the specified player, title, and mode.
+
+        Returns
+        -------
+        str
+            Key which identifies the player, title, and mode.
+        """
+
+        return f"{platform.value}/{title.value}/{mode.value}/{username}"
+
+    async def Sync(
+        self, platform: Platform, username: str, title: Title, mode: Mode, **kwargs
+    ) -> List[Match]:
+        """
+        Get the matches which a Call of Duty player has played since the
+        previous sync, then checkpoint the new high-water mark.
+
+        Parameters
+        ----------
+        platform : callofduty.Platform
+            Platform to get the player from.
+        username : str
+            Player's username for the designated platform.
+        title : callofduty.Title
+            Call of Duty title to get the player's matches from.
+        mode: callofduty.Mode
+            Call of Duty mode to get the player's matches from.
+        limit : int, optional
+            Number of matches which are requested per page, and returned
+            by the first sync of a player (default is 20.)
+
+        Returns
+        -------
+        list
+            Array of Match objects which are new since the previous sync,
+            newest first.
+        """
+
+        VerifyPlatform(platform)
+        VerifyTitle(title)
+        VerifyMode(mode, title)
+
+        limit: int = kwargs.get("limit", 20)
+        key: str = self.Key(platform, username, title, mode)
+        mark: Optional[dict] = await self.store.Load(key)
+
+        matches: List[Match] = []
+
+        if (mark is None) or (mark.get("timestamp") is None):
+            # Without a mark there is nothing to resume from, so only the
+            # most recent page is returned.
+            for match in await self.client.GetPlayerMatches(
+                platform, username, title, mode, limit=limit
+            ):
+                if (mark is not None) and (match.id == mark["id"]):
+                    break
+
+                matches.append(match)
+        else:
+            # Matches which share the mark's timestamp are returned again
+            # by the inclusive window, so they are skipped by ID.
+            known: List[int] = mark.get("ids", [mark["id"]])
+
+            async for match in self.client.GetPlayerMatchHistory(
+                platform,
+                username,
+                title,
+                mode,
+                limit=limit,
+                startTimestamp=mark["timestamp"],
+            ):
+                if match.id not in known:
+                    matches.append(match)
+
+        if len(matches) > 0:
+            newest: Match = max(matches, key=lambda m: m.timestamp or 0)
+            ids: List[int] = [m.id for m in matches if m.timestamp == newest.timestamp]
+
+            if (mark is not None) and (mark.get("timestamp") == newest.timestamp):
+                ids.extend(mark.get("ids", [mark["id"]]))
+
+            await self.store.Save(
+                key, {"id": newest.id, "timestamp": newest.timestamp, "ids": ids}
+            )
+
+        return matches
@@ -1,5 +1,23 @@
+import asyncio
+import html
 import logging
 import re
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from .enums import GameType, Language, Mode, Platform, Reaction, TimeFrame, Title
 from .errors import (
@@ -14,6 +32,10 @@ from .errors import (
 
 log: logging.Logger = logging.getLogger(__name__)
 
+# Tags never span a NUL character, which StripHTMLBulk uses to separate
+# the strings which it joins.
+_HTMLTag: re.Pattern = re.compile(r"<[^>\x00]*>")
+
 
 def VerifyPlatform(value: Platform):
     """
@@ -128,7 +150,7 @@ def VerifyReaction(value: Reaction):
 
 def StripHTML(input: str) -> str:
     """
-    Strip the HTML formatting from a string.
+    Strip the HTML formatting from a string, and decode its HTML entities.
 
     Parameters
     ----------
@@ -141,11 +163,213 @@ def StripHTML(input: str) -> str:
         Input string without the HTML formatting.
     """
 
-    # Regex is hideous, but this gets the job done faster than an external
-    # library. This is also future-proof against any sort of HTML characters,
-    # such as &nbsp and &amp.
-    expression: re.Pattern[str] = re.compile(
-        "<.*?>|&([a-z0-9]+|#[0-9]{1,6}|#x[0-9a-f]{1,6});"
-    )
+    output: str = _HTMLTag.sub("", input)
+
+    # Entities are decoded after the tags are removed, so that escaped
+    # characters such as &lt; remain in the text.
+    if "&" in output:
+        output = html.unescape(output)
+
+    return output
+
+
+def StripHTMLBulk(inputs: Iterable[Optional[str]]) -> List[Optional[str]]:
+    """
+    Strip the HTML formatting from many strings at once, which is faster
+    than calling StripHTML for each of them.
+
+    Parameters
+    ----------
+    inputs : iterable
+        HTML formatted strings, which may be None.
+
+    Returns
+    -------
+    list
+        Input strings without the HTML formatting, in the same order.
+        Inputs which are None remain None.
+    """
+
+    inputs: List[Optional[str]] = list(inputs)
+    bodies: List[str] = [input for input in inputs if input is not None]
+
+    # The bodies are joined so that they are stripped in a single call,
+    # unless one of them already contains the separator.
+    joined: str = "\x00".join(bodies)
+
+    if joined.count("\x00") == len(bodies) - 1:
+        stripped: Iterator[str] = iter(StripHTML(joined).split("\x00"))
+    else:
+        stripped: Iterator[str] = iter([StripHTML(body) for body in bodies])
+
+    return [next(stripped) if input is not None else None for input in inputs]
+
+
+class ExpiringCache:
+    """
+    Cache of awaitable results which expire after a set number of seconds.
+    Concurrent requests for the same key share a single in-flight call,
+    and failed calls are never cached.
+
+    Parameters
+    ----------
+    ttl : float or callable, optional
+        Number of seconds which a cached result remains valid, or a function
+        which returns it. A function is called on every lookup, so changes
+        apply to results which are already cached (default is None, never expire.)
+    """
+
+    def __init__(
+        self, ttl: Union[Optional[float], Callable[[], Optional[float]]] = None
+    ):
+        self.ttl: Union[Optional[float], Callable[[], Optional[float]]] = ttl
+        self._entries: Dict[Hashable, Tuple[float, asyncio.Future]] = {}
+        self._nextPrune: int = 64
+
+    async def Get(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Get the cached result for the specified key, calling the factory
+        if the result is missing or expired.
+
+        Parameters
+        ----------
+        key : object
+            Hashable key which identifies the result.
+        factory : callable
+            Function which returns an awaitable producing the result.
+
+        Returns
+        -------
+        object
+            Result of the factory call.
+        """
+
+        now: float = time.monotonic()
+
+        if (entry := self._entries.get(key)) is not None:
+            stored, future = entry
+
+            if self._Fresh(stored, now) is True:
+                return await asyncio.shield(future)
+
+        future: asyncio.Future = asyncio.ensure_future(factory())
+        future.add_done_callback(lambda f: self._Evict(key, f))
+
+        self._Store(key, future, now)
+
+        return await asyncio.shield(future)
+
+    def Set(self, key: Hashable, value: Any):
+        """
+        Store an already known result for the specified key.
+
+        Parameters
+        ----------
+        key : object
+            Hashable key which identifies the result.
+        value : object
+            Result to store.
+        """
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        future.set_result(value)
+
+        self._Store(key, future, time.monotonic())
+
+    def Invalidate(self, key: Optional[Hashable] = None):
+        """
+        Remove the specified key from the cache, or every key if none is passed.
+
+        Parameters
+        ----------
+        key : object, optional
+            Hashable key which identifies the result (default is None.)
+        """
+
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def _Fresh(self, stored: float, now: float) -> bool:
+        ttl: Optional[float] = self.ttl() if callable(self.ttl) else self.ttl
+
+        return (ttl is None) or (now - stored < ttl)
+
+    def _Store(self, key: Hashable, future: asyncio.Future, now: float):
+        if len(self._entries) >= self._nextPrune:
+            expired: list = [
+                k for k, (s, _) in self._entries.items() if not self._Fresh(s, now)
+            ]
+
+            for _key in expired:
+                del self._entries[_key]
+
+            self._nextPrune = max(64, len(self._entries) * 2)
+
+        self._entries[key] = (now, future)
+
+    def _Evict(self, key: Hashable, future: asyncio.Future):
+        if (future.cancelled() is False) and (future.exception() is None):
+            return
+
+        if ((entry := self._entries.get(key)) is not None) and (entry[1] is future):
+            del self._entries[key]
+
+
+async def AsCompleted(
+    func: Callable[[Any], Awaitable[Any]], items: Iterable[Any], concurrency: int
+) -> AsyncIterator[Tuple[Any, Any]]:
+    """
+    Call an async function for each item with bounded concurrency, yielding
+    results in the order which they complete. An exception raised for one
+    item is yielded in place of its result rather than interrupting the others.
+
+    Parameters
+    ----------
+    func : callable
+        Async function which accepts a single item.
+    items : iterable
+        Items to call the function with, consumed lazily.
+    concurrency : int
+        Maximum number of calls which may be pending at once.
+
+    Returns
+    -------
+    AsyncIterator
+        Tuples containing the item and its result or exception.
+    """
+
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, not {concurrency}")
+
+    iterator = iter(items)
+    pending: Dict[asyncio.Future, Any] = {}
+
+    def Fill():
+        for item in iterator:
+            pending[asyncio.ensure_future(func(item))] = item
+
+            if len(pending) >= concurrency:
+                break
+
+    try:
+        Fill()
+
+        while pending:
+            done: Set[asyncio.Future] = (
+                await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            )[0]
+
+            for future in done:
+                item: Any = pending.pop(future)
+
+                if (exception := future.exception()) is not None:
+                    yield (item, exception)
+                else:
+                    yield (item, future.result())
 
-    return re.sub(expression, "", input)
+            Fill()
+    finally:
+        for future in pending:
+            future.cancel()
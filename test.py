@@ -23,6 +23,11 @@ async def main():
     # for chase in season.chase:
     #     print(f"Chase: {chase.name} - {chase.rarity} {chase.category}")
 
+    # catalogue = await client.GetLootCatalogue(Title.BlackOps4)
+    # print(f"{catalogue.title.name}: {len(catalogue.seasons)} Seasons, {len(catalogue.items)} Items")
+    # for item in catalogue.byRarity("legendary"):
+    #     print(f"{item.name} - Tier {item.tier} {item.category}")
+
     # requests = await client.GetMyFriendRequests()
     # for incoming in requests["incoming"]:
     #     print(f"Incoming Friend Request: {incoming.username} ({incoming.platform.name})")
@@ -35,6 +40,9 @@ async def main():
     #     for identity in friend.identities:
     #         print(f" - {identity.platform.name}: {identity.username} ({identity.accountId})")
 
+    # async for update in client.WatchMyFriends(interval=30):
+    #     print(f"{update.event.name}: {update.player.username} ({update.player.platform.name})")
+
     # identities = await client.GetMyIdentities()
     # for identity in identities:
     #     title = identity["title"].name
@@ -49,10 +57,41 @@ async def main():
     # player = await client.GetPlayer(Platform.BattleNet, "Yeah#11207")
     # print(f"{player.username} ({player.platform.name})")
 
+    # matches = await client.GetPlayerMatches(Platform.BattleNet, "Yeah#11207", Title.ModernWarfare, Mode.Warzone)
+    # data = callofduty.Serialize(matches)
+    # for match in callofduty.Deserialize(client, data):
+    #     print(f"{match.id} ({match.timestamp})")
+
+    # player = await client.GetPlayer(Platform.BattleNet, "Yeah#11207")
+    # async for match in player.matchHistory(Title.ModernWarfare, Mode.Warzone):
+    #     print(f"{match.id} ({match.timestamp})")
+
+    # matches = await client.GetPlayerMatchesRange(
+    #     Platform.BattleNet,
+    #     "Yeah#11207",
+    #     Title.ModernWarfare,
+    #     Mode.Warzone,
+    #     1577836800000,
+    #     1609459200000,
+    # )
+    # print(f"Matches in 2020: {len(matches)}")
+
+    # sync = callofduty.MatchSync(client, callofduty.FileMatchStore("marks.json"))
+    # matches = await sync.Sync(
+    #     Platform.BattleNet, "Yeah#11207", Title.ModernWarfare, Mode.Warzone
+    # )
+    # print(f"New Matches: {len(matches)}")
+
     # player = await client.GetPlayer(Platform.BattleNet, "Yeah#11207")
     # summary = await player.matchesSummary(Title.ModernWarfare, Mode.Warzone, limit=20)
     # print(summary)
 
+    # player = await client.GetPlayer(Platform.Activision, "Yeah#11207")
+    # matches, summary = await player.matches(Title.ModernWarfare, Mode.Warzone, limit=20, summary=True)
+    # for match in matches:
+    #     print(f"{match.id}: {match.data['playerStats']['kills']} kills")
+    # print(summary)
+
     # news = await client.GetNewsFeed(limit=10)
     # for post in news:
     #     print(f"{post.published.date()}: {post.title}")
@@ -67,6 +106,20 @@ async def main():
     # for entry in leaderboard.entries:
     #     print(f"#{entry.rank}: {entry.username} ({entry.platform.name})")
 
+    # leaderboards = await asyncio.gather(
+    #     *[client.GetLeaderboard(Title.ModernWarfare, Platform.BattleNet, page=page) for page in range(1, 6)]
+    # )
+    # columns = callofduty.LeaderboardColumns.fromLeaderboards(leaderboards)
+    # top = columns.top(columns.columns[0], 10)
+    # for rank, username in zip(top.rank, top.username):
+    #     print(f"#{rank}: {username}")
+    # print(f"99th Percentile: {columns.percentile(columns.columns[0], 99)}")
+
+    # async for entry in client.GetLeaderboardEntries(
+    #     Title.ModernWarfare, Platform.BattleNet, start=1, end=10, window=5
+    # ):
+    #     print(f"#{entry.rank}: {entry.username} ({entry.platform.name})")
+
     # leaderboard = await client.GetPlayerLeaderboard(
     #     Title.BlackOps4, Platform.BattleNet, "Yeah#11207"
     # )
@@ -89,6 +142,15 @@ async def main():
     #                 if player.username != item.player.username:
     #                     print(f"                   {player.username} ({player.platform.name})")
 
+    # async for item in client.WatchFriendFeed(interval=60):
+    #     print(f"[{item.date.strftime('%Y-%m-%d %H:%M')}] {item.text}")
+
+    # feed = await client.GetFriendFeed(limit=50)
+    # texts = callofduty.utils.StripHTMLBulk([item.html for item in feed])
+    # for item, text in zip(feed, texts):
+    #     item.text = text
+    #     print(item.text)
+
     # feed = await client.GetFriendFeed(limit=5)
     # for item in feed:
     #     print(item.text)
@@ -109,6 +171,13 @@ async def main():
     #     print(item.text)
     #     await item.unfavorite()
 
+    # feed = await client.GetFriendFeed(limit=20)
+    # actions = [(item, Reaction.Fire) for item in feed]
+    # actions += [(item, callofduty.FeedAction.Favorite) for item in feed[:5]]
+    # results = await client.UpdateFeedItems(actions, concurrency=5)
+    # for (item, action), result in results.items():
+    #     print(f"{action.name}: {item.text} ({result})")
+
     # maps = await client.GetAvailableMaps(Title.ModernWarfare)
     # for mapName in maps:
     #     print(mapName)
@@ -129,6 +198,11 @@ async def main():
     # details = await match.details()
     # print(details)
 
+    # matches = await client.GetPlayerMatches(Platform.BattleNet, "Yeah#11207", Title.ModernWarfare, Mode.Warzone, limit=20)
+    # details = await client.GetMatchesDetails(matches, concurrency=5)
+    # for matchId in details:
+    #     print(f"{matchId}: {len(details[matchId]['teams'])} teams")
+
     # player = await client.GetPlayer(Platform.BattleNet, "Yeah#11207")
     # match = (await player.matches(Title.ModernWarfare, Mode.Multiplayer, limit=3))[1]
     # match = await client.GetFullMatch(Platform.Activision, Title.ModernWarfare, Mode.Multiplayer, match.id)
@@ -142,9 +216,25 @@ async def main():
     # profile = await player.profile(Title.ModernWarfare, Mode.Multiplayer)
     # print(profile)
 
+    # players = [
+    #     await client.GetPlayer(Platform.BattleNet, "Yeah#11207"),
+    #     await client.GetPlayer(Platform.PlayStation, "ImMotive__"),
+    # ]
+    # async for player, profile in client.GetPlayerProfiles(
+    #     players, Title.ModernWarfare, Mode.Multiplayer, concurrency=5
+    # ):
+    #     if isinstance(profile, Exception):
+    #         print(f"{player.username}: {profile}")
+    #     else:
+    #         print(f"{player.username}: Level {profile['level']}")
+
     # localize = await client.GetLocalize()
     # print(localize)
 
+    # localize = await client.PrefetchLocalize()
+    # for language in localize:
+    #     print(f"{language.name}: {len(localize[language])} strings")
+
     # loadouts = await client.GetPlayerLoadouts(Platform.PlayStation, "ImMotive__", Title.BlackOps4)
     # for loadout in loadouts:
     #     if loadout.name != "":
@@ -186,6 +276,10 @@ async def main():
     # for unlock in unlocks:
     #     print(unlock.id)
 
+    # player = await client.GetPlayer(Platform.PlayStation, "ImMotive__")
+    # data = await player.loadoutsAndUnlocks(Title.BlackOps4)
+    # print(f"Loadouts: {len(data['loadouts'])}, Unlocks: {len(data['unlocks'])}")
+
     # stamp = await client.GetAuthenticityStamp(
     #     Platform.BattleNet, "Slicky#21337", "Swiftly Snarling Gamy Generators"
     # )
@@ -195,6 +289,13 @@ async def main():
     # stamp = await player.authenticityStamp("Swiftly Snarling Gamy Generators")
     # print(stamp.stats)
 
+    # player = await client.ResolvePlayer(Platform.Activision, "Tustin#1365515")
+    # print(f"{player.username} ({player.accountId})")
+
+    # player = await client.GetPlayer(Platform.Activision, "Tustin#1365515")
+    # await client.ResolvePlayer(Platform.Activision, "Tustin#1365515")
+    # print(f"{player.username} ({player.accountId}, {len(client.players)} Players)")
+
     # req = await client.AddFriend(5273496286943517033)
     # print(f"Friend Request Status: {req}")
 
@@ -221,6 +322,16 @@ async def main():
     # favs = await player.removeFavorite()
     # print(f"Favorites: {len(favs)}")
 
+    # reqs = await client.AddFriends([5273496286943517033, 13940176918450289589])
+    # for accountId, req in reqs.items():
+    #     print(f"{accountId}: {req}")
+
+    # favs = await client.AddFavorites(
+    #     [(Platform.Activision, "Dad#1869899"), (Platform.Activision, "Tustin#1365515")]
+    # )
+    # for (platform, username), req in favs.items():
+    #     print(f"{username} ({platform.name}): {req}")
+
     # results = await client.SearchPlayers(Platform.Activision, "Tustin")
     # for player in results:
     #     if player.username == "Tustin#1365515":
@@ -236,6 +347,14 @@ async def main():
     #     if member.username != squad.owner.username:
     #         print(f"Member: {member.username} ({member.platform.name})")
 
+    # squad = await client.GetSquad("Autists")
+    # members = await squad.hydrate(Title.ModernWarfare, Mode.Multiplayer, loadouts=True)
+    # for member in members:
+    #     if isinstance(profile := members[member]["profile"], Exception):
+    #         print(f"{member.username}: {profile}")
+    #     else:
+    #         print(f"{member.username}: Level {profile['level']}")
+
     # squad = await client.GetPlayerSquad(Platform.Activision, "Yeah#11207")
     # print(f"{squad.name} - {squad.description}")
     # print(f"Owner: {squad.owner.username} ({squad.owner.platform.name})")